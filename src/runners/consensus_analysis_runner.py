@@ -209,38 +209,8 @@ def take_screenshot_only(page):
 
 def crop_latest_screenshot(screenshot_path):
     """Crop only the latest screenshot"""
-    import cv2
-    
-    # Load the screenshot
-    img = cv2.imread(screenshot_path)
-    if img is None:
-        print(f"    ❌ Error loading: {screenshot_path}")
-        return
-
-    base_name = Path(screenshot_path).stem
-
-    # Define crop coordinates for all three regions
-    regions = [
-        ("lexi", 271, 508, 583, 539),
-        ("mafer", 604, 509, 915, 541),
-        ("daroka", 931, 509, 1244, 541)
-    ]
-
-    # Crop each region
-    for name, x1, y1, x2, y2 in regions:
-        # Check bounds to prevent OpenCV errors
-        height, width = img.shape[:2]
-        x1 = max(0, min(x1, width))
-        y1 = max(0, min(y1, height))
-        x2 = max(0, min(x2, width))
-        y2 = max(0, min(y2, height))
-        
-        # Ensure valid crop region
-        if x1 < x2 and y1 < y2:
-            cropped = img[y1:y2, x1:x2]
-            if cropped.size > 0:  # Check if cropped image is not empty
-                cropped_filename = f"images/{base_name}_{name}_cropped.png"
-                cv2.imwrite(cropped_filename, cropped)
+    from src.utils.full_flow import crop_screenshot
+    crop_screenshot(screenshot_path)
 
 def extract_latest_data_only():
     """Extract data only from the latest cropped images"""
@@ -279,9 +249,8 @@ def extract_latest_data_only():
         try:
             print(f"    🔍 Processing: {Path(cropped_file).name}")
             # Use the OPTIMIZED enhanced image processing module (only 3 methods)
-            from src.utils.enhanced_image_processing import EnhancedImageProcessor
-            processor = EnhancedImageProcessor()
-            result = processor.extract_data_from_image_optimized(cropped_file)
+            from src.utils.enhanced_image_processing import shared_processor
+            result = shared_processor().extract_data_from_image_optimized(cropped_file)
             if result:
                 # Add metadata to the result
                 region = Path(cropped_file).stem.split('_')[-1]  # Get region from filename
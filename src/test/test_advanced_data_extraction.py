@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Tests for advanced_data_extraction
+==================================
+
+Parser regression cases (expected values are what the original per-field
+searches returned) and consensus/early-termination behaviour. No OCR runs here.
+"""
+
+import os
+from collections import Counter
+
+import cv2
+import numpy as np
+import pytest
+
+import src.utils.advanced_data_extraction as advanced_data_extraction
+from src.utils.advanced_data_extraction import (
+    _OCR_NATIVE_HEIGHT, DEBUG_OCR_CACHE_PATH, ConsensusAnalyzer, OptimizedConsensusAnalyzer, TapTapDataExtractor,
+)
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return TapTapDataExtractor()
+
+
+def _fields(b, s, t, people, dollar):
+    return {"b_value": b, "s_value": s, "t_value": t, "people_count": people, "dollar_amount": dollar}
+
+
+@pytest.mark.parametrize("text, people", [
+    ('$123,456', '123'),
+    ('B1,234,567 S12', ''),
+    ('12345 678', '678'),
+    ('1234\n👥310', '310'),
+    ('B7 S8 T9 👥310 $1,234', '310'),
+])
+def test_parse_v2_people_count_skips_longer_runs_and_comma_groups(extractor, text, people):
+    assert extractor._parse_v2(text)["people_count"] == people
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('B1,234,567 S12', _fields('1', '12', '', '234', '1,234,567')),
+    ('B7 S8 T9 👥310 S1,234', _fields('7', '8', '9', '310', '1,234')),
+    ('T12,345 B1 S2 👥100', _fields('1', '2', '12', '100', '12,345')),
+    ('@67 S7,147,640', _fields('', '7', '67', '147', '7,147,640')),
+    ('B4 S5 ©456 $2,000', _fields('4', '5', '456', '456', '2,000')),
+])
+def test_parse_v3_fields_may_share_digits(extractor, text, expected):
+    assert extractor._parse_v3(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ('B1,234,567 S12', _fields('1', '12', '', '234', '1,234,567')),
+    ('B7 S8 T9 👥310 S1,234', _fields('7', '8', '9', '310', '1,234')),
+    ('T12,345 B1 S2 👥100', _fields('1', '2', '12', '345', '12,345')),
+    ('@67 S7,147,640', _fields('67', '7', '640', '147', '7,147,640')),
+    ('B4 S5 ©456 $2,000', _fields('4', '5', '456', '456', '2,000')),
+])
+def test_parse_v4_fields_may_share_digits(extractor, text, expected):
+    assert extractor._parse_v4(text) == expected
+
+
+def test_parse_v4_uses_earliest_line_and_pattern_order(extractor):
+    # Line 1 has no B; on line 2 the "B<n>" form wins over "<n> B"
+    assert extractor._parse_v4('S5\n7 B9')["b_value"] == '9'
+    assert extractor._parse_v4('12 B\nB3')["b_value"] == '12'
+
+
+def test_parse_v4_people_count_positional_fallback(extractor):
+    # "012" is not a people count; 4-digit runs are never one either
+    fields = extractor._parse_v4('012 7 8 1234 345 9')
+    assert fields['people_count'] == '345'
+    assert (fields['b_value'], fields['s_value'], fields['t_value']) == ('8', '1234', '9')
+
+
+def test_find_consensus_breaks_ties_method_major(extractor):
+    empty = _fields('', '', '', '', '')
+    results = [
+        {'v2': empty, 'v3': _fields('', '', '1', '', ''), 'v4': empty},
+        {'v2': _fields('', '', '3', '', ''), 'v3': empty, 'v4': empty},
+    ]
+    # '1' and '3' are tied; the v2 value is counted first, so it wins
+    consensus = ConsensusAnalyzer(extractor)._find_consensus(results)
+    assert consensus['t_value'] == '3'
+    assert consensus['t_value_count'] == 1 and consensus['t_value_total'] == 2
+
+
+def test_consensus_from_values_keeps_first_seen_value_on_ties(extractor):
+    analyzer = OptimizedConsensusAnalyzer(extractor)
+    field_counts = {field: Counter() for field in analyzer.fields}
+    field_counts['b_value'].update(['9', '4', '4', '9'])
+
+    consensus = analyzer._calculate_consensus_from_values(field_counts)
+
+    # '9' and '4' both have two votes; '9' was counted first
+    assert consensus['b_value'] == '9'
+    assert consensus['b_value_count'] == 2 and consensus['b_value_total'] == 4
+    assert consensus['b_value_confidence'] == 50.0
+    assert consensus['s_value'] == '' and consensus['s_value_total'] == 0
+    # Fields without votes count as 0% in the overall average
+    assert consensus['confidence'] == pytest.approx(50.0 / len(analyzer.fields))
+
+
+@pytest.mark.parametrize("height, resized", [(_OCR_NATIVE_HEIGHT, False), (_OCR_NATIVE_HEIGHT // 4, True)])
+def test_prepare_image_without_preprocess_checks_size(extractor, tmp_path, height, resized):
+    path = str(tmp_path / "clahe_enhanced.png")
+    gradient = np.tile(np.linspace(0, 255, 200, dtype=np.uint8), (height, 1))
+    cv2.imwrite(path, gradient)
+
+    prepared = extractor._prepare_image(path, preprocess=False)
+
+    # Only the resize is skipped, and only for images at native height: too small
+    # to be "rescaled upstream" means it is upscaled after all
+    assert (prepared.shape[0] != height) == resized
+    # Grayscale input is always thresholded
+    assert cv2.countNonZero(cv2.inRange(prepared, 1, 254)) == 0
+
+
+def test_prepare_image_upscales_small_binary_crops(extractor, tmp_path):
+    path = str(tmp_path / "otsu_binarized.png")
+    binary = np.zeros((30, 80), np.uint8)
+    binary[10:20, 20:60] = 255
+    cv2.imwrite(path, binary)
+
+    prepared = extractor._prepare_image(path)
+
+    # Upscaled like any small crop, without blurring it out of being binary
+    assert np.array_equal(prepared, binary.repeat(2, axis=0).repeat(2, axis=1))
+
+
+def test_batch_extract_reuses_parent_cache_without_a_pool(tmp_path, monkeypatch):
+    extractor = TapTapDataExtractor()
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"crop_{i}.png"
+        cv2.imwrite(str(path), np.full((10, 10), 255, np.uint8))
+        paths.append(str(path))
+        extractor._remember(extractor._ocr_cache_key(str(path)), f'B{i} S5 T6 👥310')
+
+    def no_pool(*args, **kwargs):
+        raise AssertionError("cached images must not start a process pool")
+    monkeypatch.setattr(advanced_data_extraction, 'ProcessPoolExecutor', no_pool)
+
+    results = extractor.batch_extract_advanced(str(tmp_path))
+
+    assert sorted(r['final_result']['b_value'] for r in results) == ['0', '1', '2']
+
+
+def test_debug_ocr_cache_path_does_not_depend_on_working_directory():
+    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(advanced_data_extraction.__file__))))
+    assert DEBUG_OCR_CACHE_PATH == os.path.join(repo_root, "images", ".ocr_cache.sqlite")
+
+
+def test_disk_cache_miss_reads_the_file_once_and_hits_across_extractors(tmp_path, monkeypatch):
+    path = str(tmp_path / "crop.png")
+    cv2.imwrite(path, np.full((10, 10), 255, np.uint8))
+    cache_path = str(tmp_path / "ocr.sqlite")
+
+    # The bytes read for the hash are decoded directly; the file is not reopened by imread
+    def no_imread(*args, **kwargs):
+        raise AssertionError("image was read a second time")
+    monkeypatch.setattr(cv2, 'imread', no_imread)
+
+    first = TapTapDataExtractor(cache_path)
+    monkeypatch.setattr(first, '_ocr_batch', lambda images: [' B1 S2 '] * len(images))
+    assert first._ocr_path(path) == 'B1 S2'
+
+    second = TapTapDataExtractor(cache_path)
+    monkeypatch.setattr(second, '_ocr_batch', lambda images: pytest.fail("disk cache was not used"))
+    assert second._ocr_path(path) == 'B1 S2'
+
+
+def test_disk_cache_key_includes_prepare_settings(tmp_path, monkeypatch):
+    path = str(tmp_path / "crop.png")
+    cv2.imwrite(path, np.full((10, 10), 255, np.uint8))
+    cache_path = str(tmp_path / "ocr.sqlite")
+
+    first = TapTapDataExtractor(cache_path)
+    monkeypatch.setattr(first, '_ocr_batch', lambda images: ['old'] * len(images))
+    first._ocr_path(path)
+
+    # Changing how images are prepared invalidates text OCR'd under the old settings
+    monkeypatch.setattr(advanced_data_extraction, '_PREPARE_KEY', 'changed')
+    second = TapTapDataExtractor(cache_path)
+    monkeypatch.setattr(second, '_ocr_batch', lambda images: ['new'] * len(images))
+    assert second._ocr_path(path) == 'new'
+
+
+class _FakeOcrJob:
+    """Stands in for an OCR future; records whether it was consumed or cancelled"""
+    def __init__(self):
+        self.consumed = False
+        self.cancelled = False
+
+    def result(self):
+        self.consumed = True
+        return 'B7 S8 T9'
+
+    def cancel(self):
+        self.cancelled = True
+        return True
+
+
+class _FakeExecutor:
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, fn, *args):
+        job = _FakeOcrJob()
+        self.jobs.append(job)
+        return job
+
+
+def test_settled_consensus_cancels_remaining_ocr_jobs(extractor, monkeypatch):
+    analyzer = OptimizedConsensusAnalyzer(extractor)
+    # Settle once 4 of the 8 images have been tallied
+    monkeypatch.setattr(analyzer, '_consensus_is_settled', lambda counts, remaining: remaining <= 4)
+    executor = _FakeExecutor()
+    image_files = [f'image_{i}.png' for i in range(8)]
+
+    # A threshold above 100% means only the settled check can stop early
+    result = analyzer._process_images_with_early_termination(
+        'images', image_files, 'r1', 101.0, executor, max_in_flight=3
+    )
+
+    assert result['images_processed'] == 4
+    # One window ahead of the last tallied image was submitted, the 8th never was
+    assert len(executor.jobs) == 7
+    assert all(job.consumed and not job.cancelled for job in executor.jobs[:4])
+    assert all(job.cancelled and not job.consumed for job in executor.jobs[4:])
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for enhanced_image_processing
+===================================
+
+sauvola_threshold against a brute-force windowed reference. No OCR runs here.
+"""
+
+import numpy as np
+import pytest
+
+from src.utils.enhanced_image_processing import EnhancedImageProcessor
+
+
+def _sauvola_reference(gray, window, k, dynamic_range):
+    """Per-pixel mean/std over the window, with the same reflected border as cv2.BORDER_REFLECT"""
+    half = window // 2
+    padded = np.pad(gray.astype(np.float64), half, mode='symmetric')
+    threshold = np.empty(gray.shape)
+    for y in range(gray.shape[0]):
+        for x in range(gray.shape[1]):
+            patch = padded[y:y + window, x:x + window]
+            threshold[y, x] = patch.mean() * (1 + k * (patch.std() / dynamic_range - 1))
+    return threshold
+
+
+@pytest.mark.parametrize("window, k", [(15, 0.2), (5, 0.5), (3, 0.1)])
+def test_sauvola_threshold_matches_brute_force_windows(window, k):
+    gray = np.random.default_rng(window).integers(0, 256, size=(20, 20), dtype=np.uint8)
+
+    result = EnhancedImageProcessor().sauvola_threshold(gray, window=window, k=k)
+    threshold = _sauvola_reference(gray, window, k, 128.0)
+
+    assert result.dtype == np.uint8 and result.shape == gray.shape
+    # Every pixel, border windows included; pixels sitting on the threshold are
+    # left out since float rounding may put them on either side
+    decided = np.abs(gray - threshold) > 1e-6
+    assert decided.mean() > 0.95
+    assert np.array_equal(result[decided], np.where(gray > threshold, 255, 0)[decided])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for full_flow
+===================
+
+crop_screenshot on synthetic screenshots written to a temporary images folder.
+"""
+
+import cv2
+import numpy as np
+import pytest
+
+from src.utils.enhanced_image_processing import load_grayscale
+from src.utils.full_flow import CROP_MIN_SHAPE, CROP_REGIONS, crop_screenshot
+
+
+@pytest.fixture
+def images_dir(tmp_path, monkeypatch):
+    # crop_screenshot writes into images/ relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "images").mkdir()
+    return tmp_path / "images"
+
+
+def _write_screenshot(images_dir, height, width):
+    rng = np.random.default_rng(0)
+    img = rng.integers(0, 256, size=(height, width, 3), dtype=np.uint8)
+    path = images_dir / "screenshot_test.png"
+    cv2.imwrite(str(path), img)
+    return str(path), img
+
+
+def test_crop_screenshot_writes_every_region(images_dir):
+    path, img = _write_screenshot(images_dir, *CROP_MIN_SHAPE)
+
+    crops = crop_screenshot(path)
+
+    assert sorted(crops) == sorted(f"screenshot_test_{name}_cropped.png" for name, *_ in CROP_REGIONS)
+    for name, x1, y1, x2, y2 in CROP_REGIONS:
+        cropped_file = f"screenshot_test_{name}_cropped.png"
+        # Every threaded write has finished by the time crop_screenshot returns
+        written = cv2.imread(str(images_dir / cropped_file))
+        assert np.array_equal(written, img[y1:y2, x1:x2])
+        assert np.array_equal(crops[cropped_file], cv2.cvtColor(img[y1:y2, x1:x2], cv2.COLOR_BGR2GRAY))
+
+
+def test_crop_screenshot_clamps_regions_of_small_screenshots(images_dir):
+    # Wide enough for the first region only, and a few rows short of every region's bottom
+    _, x1, y1, x2, y2 = CROP_REGIONS[0]
+    height, width = CROP_MIN_SHAPE[0] - 5, x2 + 10
+    path, img = _write_screenshot(images_dir, height, width)
+
+    crops = crop_screenshot(path)
+
+    assert list(crops) == [f"screenshot_test_{CROP_REGIONS[0][0]}_cropped.png"]
+    written = cv2.imread(str(images_dir / f"screenshot_test_{CROP_REGIONS[0][0]}_cropped.png"))
+    assert np.array_equal(written, img[y1:height, x1:x2])
+
+
+def test_crop_screenshot_rejects_non_png(images_dir):
+    path = images_dir / "screenshot_test.png"
+    path.write_bytes(b"\xff\xd8\xff\xe0 not a png")
+
+    assert crop_screenshot(str(path)) == {}
+    assert list(images_dir.iterdir()) == [path]
+
+
+def test_in_memory_crops_match_a_rerun_from_disk(images_dir):
+    path, _ = _write_screenshot(images_dir, *CROP_MIN_SHAPE)
+
+    crops = crop_screenshot(path)
+
+    # A later run reads the saved PNGs instead; it must see the same pixels
+    for cropped_file, gray in crops.items():
+        assert np.array_equal(load_grayscale(str(images_dir / cropped_file)), gray)
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Tests for ocr_cache
+===================
+
+OcrDiskCache round trips, a missing folder, and pickling.
+"""
+
+import pickle
+
+from src.utils.ocr_cache import OcrDiskCache
+
+
+def test_set_then_get_round_trips(tmp_path):
+    cache = OcrDiskCache(str(tmp_path / "ocr.sqlite"))
+
+    assert cache.get("key") is None
+    cache.set("key", "B1 S2")
+    cache.set("key", "B3 S4")  # replaces the earlier text
+    assert cache.get("key") == "B3 S4"
+    cache.close()
+
+    # A new handle reads what the first one committed
+    assert OcrDiskCache(str(tmp_path / "ocr.sqlite")).get("key") == "B3 S4"
+
+
+def test_missing_folder_disables_the_cache(tmp_path):
+    path = tmp_path / "missing" / "ocr.sqlite"
+    cache = OcrDiskCache(str(path))
+
+    cache.set("key", "text")
+    assert cache.get("key") is None
+    assert not path.parent.exists()
+
+
+def test_hash_file_matches_hash_bytes(tmp_path):
+    image_path = tmp_path / "crop.png"
+    image_path.write_bytes(b"pixels")
+
+    assert OcrDiskCache.hash_file(str(image_path)) == OcrDiskCache.hash_bytes(b"pixels")
+    assert OcrDiskCache.hash_file(str(tmp_path / "absent.png")) is None
+
+
+def test_pickling_drops_the_connection_and_reopens(tmp_path):
+    cache = OcrDiskCache(str(tmp_path / "ocr.sqlite"))
+    cache.set("key", "text")
+
+    clone = pickle.loads(pickle.dumps(cache))
+
+    assert clone._connection is None
+    assert clone.get("key") == "text"
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Tests for tesseract_engine
+==========================
+
+List-file batching on the subprocess path, with the Tesseract run faked: the
+fake reads the list file and writes the output Tesseract would have produced.
+"""
+
+import pickle
+import subprocess
+
+import numpy as np
+import pytest
+
+import src.utils.tesseract_engine as tesseract_engine
+from src.utils.tesseract_engine import TesseractEngine
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    # Force the pytesseract path even when tesserocr is installed
+    monkeypatch.setattr(tesseract_engine, 'PyTessBaseAPI', None)
+    return TesseractEngine(psm=7, whitelist='0123456789')
+
+
+def _fake_tesseract(monkeypatch, output):
+    """Make the batch run write output to the .txt file and record each command."""
+    calls = []
+
+    def run(command, capture_output):
+        calls.append(command)
+        list_path, output_base = command[1], command[2]
+        with open(list_path, encoding="utf-8") as list_file:
+            calls.append(list_file.read().split())
+        with open(output_base + ".txt", "w", encoding="utf-8") as output_file:
+            output_file.write(output)
+        return subprocess.CompletedProcess(command, 0, b"", b"")
+
+    monkeypatch.setattr(tesseract_engine.subprocess, 'run', run)
+    return calls
+
+
+def _images(count):
+    return [np.full((8, 8), 255, np.uint8) for _ in range(count)]
+
+
+def test_batch_splits_pages_on_form_feed(engine, monkeypatch):
+    calls = _fake_tesseract(monkeypatch, "12\n\f34\n\f56\n\f")
+
+    assert engine.images_to_strings(_images(3)) == ["12\n", "34\n", "56\n"]
+    command, listed = calls
+    assert len(listed) == 3
+    assert command[3:] == engine.config.split()
+
+
+def test_batch_keeps_empty_pages_in_place(engine, monkeypatch):
+    _fake_tesseract(monkeypatch, "12\n\f\f56\n\f")
+
+    assert engine.images_to_strings(_images(3)) == ["12\n", "", "56\n"]
+
+
+def test_batch_pads_short_page_count(engine, monkeypatch):
+    # Tesseract dropped the trailing pages
+    _fake_tesseract(monkeypatch, "12\n")
+
+    assert engine.images_to_strings(_images(3)) == ["12\n", "", ""]
+
+
+def test_batch_raises_on_tesseract_failure(engine, monkeypatch):
+    def run(command, capture_output):
+        return subprocess.CompletedProcess(command, 1, b"", b"bad config")
+    monkeypatch.setattr(tesseract_engine.subprocess, 'run', run)
+
+    with pytest.raises(tesseract_engine.pytesseract.TesseractError):
+        engine.images_to_strings(_images(2))
+
+
+def test_single_image_bypasses_the_list_file(engine, monkeypatch):
+    monkeypatch.setattr(tesseract_engine.subprocess, 'run', lambda *args, **kwargs: pytest.fail("batch run used"))
+    monkeypatch.setattr(tesseract_engine.pytesseract, 'image_to_string', lambda image, config: f"one {config}")
+
+    assert engine.images_to_strings(_images(1)) == [f"one {engine.config}"]
+    assert engine.images_to_strings([]) == []
+
+
+def test_set_psm_updates_config(engine):
+    engine.set_psm(13)
+    assert engine.config == TesseractEngine.build_config(13, '0123456789')
+
+
+def test_pickling_drops_the_native_handle(engine):
+    engine._api = object()
+    clone = pickle.loads(pickle.dumps(engine))
+
+    assert clone._api is None
+    assert (clone.psm, clone.whitelist, clone.config) == (engine.psm, engine.whitelist, engine.config)
+    engine._api = None
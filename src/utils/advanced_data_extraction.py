@@ -8,12 +8,89 @@ and combines results for better accuracy with optimized consensus analysis.
 """
 
 import os
+import sys
 import cv2
-import pytesseract
+import numpy as np
 import re
+import contextlib
 import csv
-from collections import Counter, defaultdict
-from typing import Dict, List, Tuple, Optional
+import functools
+import heapq
+from collections import Counter, deque
+from pathlib import Path
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Dict, Iterable, List, Tuple, Optional
+
+from src.utils.ocr_cache import OcrDiskCache
+from src.utils.tesseract_engine import TesseractEngine
+
+# Precompiled OCR text patterns shared by the v2/v3/v4 parsers
+_RE_ALL_NUMBERS = re.compile(r'\d+')
+_RE_COMMA_NUMBER = re.compile(r'\d{1,3}(?:,\d{3})+')
+
+# 3-digit number that is not part of a longer digit run and does not follow a
+# comma (the leading group of a comma number such as "123,456" still matches)
+_RE_PEOPLE = re.compile(r'(?<![\d,])(\d{3})(?!\d)')
+
+# v3 primary patterns and their fallbacks. Each field is searched on its own:
+# fields may share digits (e.g. "B1,234" feeds both B and the dollar amount), so
+# a single non-overlapping tokenizer cannot reproduce these results.
+_RE_V3_B = re.compile(r'\bB\s?(\d{1,3})')
+_RE_V3_S = re.compile(r'\bS\s?(\d{1,3})')
+_RE_V3_T = re.compile(r'[\u25CB@\*oO\)§©]\s?(\d{1,3})')
+_RE_V3_PEOPLE = re.compile(r'[👥#@§© ](\d{3})\b')
+_RE_V3_DOLLAR = re.compile(r'\$\s?(\d{1,3}(?:,\d{3})+)')
+_RE_V3_B_FALLBACK = re.compile(r'B(\d{1,3})')
+_RE_V3_S_FALLBACK = re.compile(r'S(\d{1,3})')
+_RE_V3_T_FALLBACK = re.compile(r'[T@](\d{1,3})')
+_RE_V3_PEOPLE_FALLBACK = re.compile(r'(\d{3})')
+_RE_V3_DOLLAR_FALLBACK = re.compile(r'(\d{1,3}(?:,\d{3})+)')
+
+# v4 per-line patterns, tried in order
+_V4_B_PATTERNS = tuple(re.compile(p) for p in (r'B(\d{1,3})', r'\b(\d{1,3})\s*B', r'B\s*(\d{1,3})'))
+_V4_S_PATTERNS = tuple(re.compile(p) for p in (r'S(\d{1,3})', r'\b(\d{1,3})\s*S', r'S\s*(\d{1,3})'))
+_V4_T_PATTERNS = tuple(re.compile(p) for p in (r'[T@§©](\d{1,3})', r'\b(\d{1,3})\s*[T@§©]', r'[T@§©]\s*(\d{1,3})'))
+
+# Longest side (px) of the image handed to Tesseract; small crops are still upscaled 2x
+_OCR_MAX_SIDE = 1200
+_OCR_UPSCALE = 2.0
+
+# Images at least this tall already have text large enough for Tesseract
+_OCR_NATIVE_HEIGHT = 400
+
+# Maximum number of OCR texts kept per extractor
+_OCR_CACHE_SIZE = 512
+
+# Regions with fewer selected images are OCR'd serially: early termination
+# usually stops after a few images, so starting worker processes (spawned on
+# Windows) and pickling the extractor would cost more than it saves
+_POOL_MIN_IMAGES = 8
+
+# Persistent OCR cache for the debug images, shared across runs; resolved from
+# this file so every working directory uses the same database
+DEBUG_OCR_CACHE_PATH = str(Path(__file__).resolve().parents[2] / "images" / ".ocr_cache.sqlite")
+
+# Bump when _prepare_image changes; with its size constants it is part of the
+# disk-cache key, so text OCR'd from differently prepared images is not reused
+_PREPARE_VERSION = 2
+_PREPARE_KEY = f"p{_PREPARE_VERSION}-{_OCR_MAX_SIDE}-{_OCR_UPSCALE}-{_OCR_NATIVE_HEIGHT}"
+
+
+def _first_line_match(text: str, markers: str, patterns: Tuple[re.Pattern, ...]) -> str:
+    """
+    Return group 1 of the first of patterns to match on the earliest line where one matches.
+    
+    Every pattern needs one of the marker characters, so lines without one are skipped
+    without running the regexes.
+    """
+    for line in text.split('\n'):
+        if not any(marker in line for marker in markers):
+            continue
+        for pattern in patterns:
+            match = pattern.search(line)
+            if match:
+                return match.group(1)
+    return ''
 
 
 class TapTapDataExtractor:
@@ -21,42 +98,151 @@ class TapTapDataExtractor:
     Main class for extracting data from TapTap images using multiple OCR methods.
     """
     
-    def __init__(self):
-        """Initialize the data extractor with default settings."""
+    def __init__(self, disk_cache_path: Optional[str] = None):
+        """
+        Initialize the data extractor with default settings.
+
+        Args:
+            disk_cache_path: Optional SQLite file that keeps OCR text across runs,
+                keyed by image content hash
+        """
         self.regions = ['daroka', 'lexi', 'mafer']
         self.fields = ['b_value', 's_value', 't_value', 'people_count', 'dollar_amount']
-        
-    def extract_lisa_data_v2(self, image_path: str) -> Dict:
-        """Extract data using v2 method with people count detection"""
-        image = cv2.imread(image_path)
-        if image is None:
-            return {"error": f"❌ Cannot read image: {image_path}"}
+        # OCR text keyed by (path, mtime, size, preprocess) so v2/v3/v4 share one Tesseract run
+        self._ocr_cache = {}
+        # Single Tesseract handle (in-process when tesserocr is available)
+        self._engine = TesseractEngine(psm=6)
+        self._disk_cache = OcrDiskCache(disk_cache_path) if disk_cache_path else None
+
+    def _prepare_image(self, image_path: str, preprocess: bool = True,
+                       data: Optional[bytes] = None) -> Optional[np.ndarray]:
+        """
+        Load an image as grayscale and prepare it for Tesseract.
 
-        image_resized = cv2.resize(image, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
-        gray = cv2.cvtColor(image_resized, cv2.COLOR_BGR2GRAY)
+        Small images are upscaled and everything is Otsu-thresholded; images that
+        are already binary (e.g. thresholded debug variants) skip the threshold.
+        Pass preprocess=False for images rescaled upstream; it only skips the
+        resize, and only when the image is at least _OCR_NATIVE_HEIGHT tall.
+        If the file's bytes were already read, pass them as data to decode those.
+        """
+        if data is not None:
+            gray = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_GRAYSCALE)
+        else:
+            gray = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+        if gray is None:
+            return None
+
+        # Any pixel strictly between 0 and 255 means the image is not binary yet
+        is_binary = cv2.countNonZero(cv2.inRange(gray, 1, 254)) == 0
+
+        # Upscale small crops, but never past _OCR_MAX_SIDE; large screenshots are shrunk.
+        # preprocess=False is checked rather than trusted: a small image is still upscaled
+        height = gray.shape[0]
+        if preprocess or height < _OCR_NATIVE_HEIGHT:
+            upscale = 1.0 if height >= _OCR_NATIVE_HEIGHT else _OCR_UPSCALE
+            scale = min(upscale, _OCR_MAX_SIDE / max(gray.shape[:2]))
+            if scale > 1:
+                # Nearest-neighbour keeps a binary image binary
+                interpolation = cv2.INTER_NEAREST if is_binary else cv2.INTER_LINEAR
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=interpolation)
+            elif scale < 1:
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+                is_binary = False
+
+        # Re-thresholding a binary image is a no-op for OCR
+        if is_binary:
+            return gray
         _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return thresh
 
-        config_all = r'--oem 3 --psm 6'
-        text_all = pytesseract.image_to_string(thresh, config=config_all)
+    def _ocr_image(self, image: np.ndarray) -> str:
+        """Run Tesseract on a single prepared image"""
+        return self._engine.image_to_string(image)
 
-        def extract_numbers_with_commas(text):
-            return re.findall(r'\d{1,3}(?:,\d{3})+', text)
+    def _ocr_batch(self, images: List[np.ndarray]) -> List[str]:
+        """OCR several prepared images with a single Tesseract call"""
+        return self._engine.images_to_strings(images)
 
-        def extract_all_numbers(text):
-            return re.findall(r'\d+', text)
+    def _ocr_paths(self, image_paths: List[str], preprocess: bool = True) -> List[Optional[str]]:
+        """
+        OCR image files, reusing cached text for files that have not changed.
+        Uncached images are batched into a single Tesseract call. Returns None
+        for images that cannot be read.
+        """
+        keys = [self._ocr_cache_key(image_path, preprocess) for image_path in image_paths]
 
-        def extract_people_count(text):
-            lines = text.split('\n')
-            for line in lines:
-                # Improved pattern to catch more variations
-                match = re.search(r'[@#oO§© ]?(\d{3})\b', line)
-                if match:
-                    return match.group(1)
-            return ''
+        texts = [self._ocr_cache.get(key) if key else None for key in keys]
 
-        numbers_with_commas = extract_numbers_with_commas(text_all)
-        all_numbers = extract_all_numbers(text_all)
-        people = extract_people_count(text_all)
+        pending = []
+        disk_keys = {}
+        for i, key in enumerate(keys):
+            if key is None or texts[i] is not None:
+                continue
+            data = None
+            if self._disk_cache is not None:
+                # Read the file once: the bytes are hashed here and decoded on a miss
+                try:
+                    with open(image_paths[i], 'rb') as image_file:
+                        data = image_file.read()
+                except OSError:
+                    continue
+                # Content hash plus settings, so regenerated but identical images still hit
+                digest = OcrDiskCache.hash_bytes(data)
+                disk_keys[i] = f"{digest}:{int(preprocess)}:{_PREPARE_KEY}:{self._engine.config}"
+                texts[i] = self._disk_cache.get(disk_keys[i])
+                if texts[i] is not None:
+                    self._remember(key, texts[i])
+                    continue
+            thresh = self._prepare_image(image_paths[i], preprocess, data)
+            if thresh is not None:
+                pending.append((i, thresh))
+
+        if pending:
+            batch_texts = self._ocr_batch([thresh for _, thresh in pending])
+            for (i, _), text_all in zip(pending, batch_texts):
+                texts[i] = text_all.strip()
+                self._remember(keys[i], texts[i])
+                if i in disk_keys:
+                    self._disk_cache.set(disk_keys[i], texts[i])
+
+        return texts
+
+    def _ocr_cache_key(self, image_path: str, preprocess: bool = True) -> Optional[Tuple]:
+        """In-memory cache key for an image file, or None if the file cannot be read"""
+        try:
+            stat = os.stat(image_path)
+        except OSError:
+            return None
+        return (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size, preprocess)
+
+    def _remember(self, key: Tuple, text_all: str) -> None:
+        """Store OCR text in the in-memory cache, evicting the oldest entry when full"""
+        if len(self._ocr_cache) >= _OCR_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del self._ocr_cache[next(iter(self._ocr_cache))]
+        self._ocr_cache[key] = text_all
+
+    def _ocr_path(self, image_path: str, preprocess: bool = True) -> Optional[str]:
+        """OCR a single image file through the shared cache"""
+        return self._ocr_paths([image_path], preprocess)[0]
+
+    def extract_lisa_data_v2(self, image_path: str, preprocess: bool = True) -> Dict:
+        """Extract data using v2 method with people count detection"""
+        text_all = self._ocr_path(image_path, preprocess)
+        if text_all is None:
+            return {"error": f"❌ Cannot read image: {image_path}"}
+
+        return {
+            "raw_text": text_all,
+            "mapped_result": self._parse_v2(text_all)
+        }
+
+    def _parse_v2(self, text_all: str) -> Dict:
+        """Map OCR text to fields using v2 position-based rules"""
+        numbers_with_commas = _RE_COMMA_NUMBER.findall(text_all)
+        all_numbers = _RE_ALL_NUMBERS.findall(text_all)
+        people_match = _RE_PEOPLE.search(text_all)
+        people = people_match.group(1) if people_match else ''
 
         b_val = ''
         s_val = ''
@@ -80,42 +266,27 @@ class TapTapDataExtractor:
             "dollar_amount": numbers_with_commas[0] if numbers_with_commas else ''
         }
 
-        return {
-            "raw_text": text_all.strip(),
-            "mapped_result": mapped
-        }
+        return mapped
 
-    def extract_game_stat_v3(self, image_path: str) -> Dict:
+    def extract_game_stat_v3(self, image_path: str, preprocess: bool = True) -> Dict:
         """Extract data using v3 method with improved pattern matching"""
-        image = cv2.imread(image_path)
-        if image is None:
+        text_all = self._ocr_path(image_path, preprocess)
+        if text_all is None:
             return {"error": f"❌ Cannot read image: {image_path}"}
 
-        image_resized = cv2.resize(image, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
-        gray = cv2.cvtColor(image_resized, cv2.COLOR_BGR2GRAY)
-        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+        return {
+            "raw_text": text_all,
+            "mapped_result": self._parse_v3(text_all)
+        }
 
-        config_all = r'--oem 3 --psm 6'
-        text_all = pytesseract.image_to_string(thresh, config=config_all).strip()
-
-        # Improved regex patterns for better matching
-        b_match = re.search(r'\bB\s?(\d{1,3})', text_all)
-        s_match = re.search(r'\bS\s?(\d{1,3})', text_all)
-        t_match = re.search(r'[\u25CB@\*oO\)§©]\s?(\d{1,3})', text_all)
-        p_match = re.search(r'[👥#@§© ](\d{3})\b', text_all)
-        dollar_match = re.search(r'\$\s?(\d{1,3}(?:,\d{3})+)', text_all)
-
-        # Additional patterns for better extraction
-        if not b_match:
-            b_match = re.search(r'B(\d{1,3})', text_all)
-        if not s_match:
-            s_match = re.search(r'S(\d{1,3})', text_all)
-        if not t_match:
-            t_match = re.search(r'[T@](\d{1,3})', text_all)
-        if not p_match:
-            p_match = re.search(r'(\d{3})', text_all)  # Fallback for people count
-        if not dollar_match:
-            dollar_match = re.search(r'(\d{1,3}(?:,\d{3})+)', text_all)  # Fallback for dollar
+    def _parse_v3(self, text_all: str) -> Dict:
+        """Map OCR text to fields using v3 prefix patterns"""
+        # Improved regex patterns for better matching, with fallbacks
+        b_match = _RE_V3_B.search(text_all) or _RE_V3_B_FALLBACK.search(text_all)
+        s_match = _RE_V3_S.search(text_all) or _RE_V3_S_FALLBACK.search(text_all)
+        t_match = _RE_V3_T.search(text_all) or _RE_V3_T_FALLBACK.search(text_all)
+        p_match = _RE_V3_PEOPLE.search(text_all) or _RE_V3_PEOPLE_FALLBACK.search(text_all)
+        dollar_match = _RE_V3_DOLLAR.search(text_all) or _RE_V3_DOLLAR_FALLBACK.search(text_all)
 
         mapped = {
             "b_value": b_match.group(1) if b_match else '',
@@ -125,83 +296,47 @@ class TapTapDataExtractor:
             "dollar_amount": dollar_match.group(1) if dollar_match else ''
         }
 
-        return {
-            "raw_text": text_all,
-            "mapped_result": mapped
-        }
+        return mapped
 
-    def extract_stat_v4(self, image_path: str) -> Dict:
+    def extract_stat_v4(self, image_path: str, preprocess: bool = True) -> Dict:
         """New v4 method with enhanced pattern recognition"""
-        image = cv2.imread(image_path)
-        if image is None:
+        text_all = self._ocr_path(image_path, preprocess)
+        if text_all is None:
             return {"error": f"❌ Cannot read image: {image_path}"}
 
-        image_resized = cv2.resize(image, None, fx=2, fy=2, interpolation=cv2.INTER_CUBIC)
-        gray = cv2.cvtColor(image_resized, cv2.COLOR_BGR2GRAY)
-        _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-
-        config_all = r'--oem 3 --psm 6'
-        text_all = pytesseract.image_to_string(thresh, config=config_all).strip()
+        return {
+            "raw_text": text_all,
+            "mapped_result": self._parse_v4(text_all)
+        }
 
+    def _parse_v4(self, text_all: str) -> Dict:
+        """Map OCR text to fields using v4 per-line patterns with positional fallback"""
         # Extract all numbers first
-        all_numbers = re.findall(r'\d+', text_all)
-        numbers_with_commas = re.findall(r'\d{1,3}(?:,\d{3})+', text_all)
-        
-        # Find people count (3-digit numbers)
-        people_count = ''
-        for num in all_numbers:
-            if len(num) == 3 and 100 <= int(num) <= 999:
-                people_count = num
-                break
-        
+        all_numbers = _RE_ALL_NUMBERS.findall(text_all)
+        dollar_match = _RE_COMMA_NUMBER.search(text_all)
+
+        # Find people count: the first 3-digit number in 100..999 (its index is
+        # reused for the positional fallback)
+        p_idx = next((i for i, num in enumerate(all_numbers) if len(num) == 3 and int(num) >= 100), None)
+        people_count = all_numbers[p_idx] if p_idx is not None else ''
+
         # Find dollar amount
-        dollar_amount = numbers_with_commas[0] if numbers_with_commas else ''
-        
-        # Find B, S, T values by looking for patterns
-        b_value = ''
-        s_value = ''
-        t_value = ''
-        
-        # Look for B/S/T patterns in text
-        lines = text_all.split('\n')
-        for line in lines:
-            # B value patterns
-            b_patterns = [r'B(\d{1,3})', r'\b(\d{1,3})\s*B', r'B\s*(\d{1,3})']
-            for pattern in b_patterns:
-                match = re.search(pattern, line)
-                if match and not b_value:
-                    b_value = match.group(1)
-                    break
-            
-            # S value patterns
-            s_patterns = [r'S(\d{1,3})', r'\b(\d{1,3})\s*S', r'S\s*(\d{1,3})']
-            for pattern in s_patterns:
-                match = re.search(pattern, line)
-                if match and not s_value:
-                    s_value = match.group(1)
-                    break
-            
-            # T value patterns
-            t_patterns = [r'[T@§©](\d{1,3})', r'\b(\d{1,3})\s*[T@§©]', r'[T@§©]\s*(\d{1,3})']
-            for pattern in t_patterns:
-                match = re.search(pattern, line)
-                if match and not t_value:
-                    t_value = match.group(1)
-                    break
-        
+        dollar_amount = dollar_match.group() if dollar_match else ''
+
+        # Find B, S, T values by looking for patterns line by line
+        b_value = _first_line_match(text_all, 'B', _V4_B_PATTERNS)
+        s_value = _first_line_match(text_all, 'S', _V4_S_PATTERNS)
+        t_value = _first_line_match(text_all, 'T@§©', _V4_T_PATTERNS)
+
         # If not found by patterns, try position-based extraction
-        if not b_value and len(all_numbers) >= 3:
-            # Find the position of people count
-            try:
-                p_idx = next(i for i, v in enumerate(all_numbers) if v == people_count)
-                if p_idx >= 2:
-                    b_value = all_numbers[p_idx - 2]
-                if p_idx >= 1:
-                    s_value = all_numbers[p_idx - 1]
-                if p_idx + 1 < len(all_numbers):
-                    t_value = all_numbers[p_idx + 1]
-            except StopIteration:
-                pass
+        # (relative to the position of the people count)
+        if not b_value and len(all_numbers) >= 3 and p_idx is not None:
+            if p_idx >= 2:
+                b_value = all_numbers[p_idx - 2]
+            if p_idx >= 1:
+                s_value = all_numbers[p_idx - 1]
+            if p_idx + 1 < len(all_numbers):
+                t_value = all_numbers[p_idx + 1]
 
         mapped = {
             "b_value": b_value,
@@ -211,46 +346,55 @@ class TapTapDataExtractor:
             "dollar_amount": dollar_amount
         }
 
-        return {
-            "raw_text": text_all,
-            "mapped_result": mapped
-        }
+        return mapped
 
-    def extract_stat_combined(self, image_path: str) -> Dict:
+    def extract_stat_combined(self, image_path: str, preprocess: bool = True) -> Dict:
         """Combine results from v2, v3, and v4 methods"""
-        result_v2 = self.extract_lisa_data_v2(image_path)
-        result_v3 = self.extract_game_stat_v3(image_path)
-        result_v4 = self.extract_stat_v4(image_path)
-
-        merged = {}
-        for key in self.fields:
-            # Priority: v4 > v3 > v2
-            val_v4 = result_v4["mapped_result"].get(key, '')
-            val_v3 = result_v3["mapped_result"].get(key, '')
-            val_v2 = result_v2["mapped_result"].get(key, '')
-            
-            merged[key] = val_v4 if val_v4 else (val_v3 if val_v3 else val_v2)
+        # OCR once and let all three parsers work on the same text.
+        # Unreadable images yield empty fields rather than raising.
+        text_all = self._ocr_path(image_path, preprocess) or ''
+        result_v2 = self._parse_v2(text_all)
+        result_v3 = self._parse_v3(text_all)
+        result_v4 = self._parse_v4(text_all)
+
+        # Priority: v4 > v3 > v2
+        merged = {
+            key: next(filter(None, (result_v4.get(key), result_v3.get(key), result_v2.get(key))), '')
+            for key in self.fields
+        }
 
         return {
             "file": os.path.basename(image_path),
             "final_result": merged,
-            "v2_result": result_v2["mapped_result"],
-            "v3_result": result_v3["mapped_result"],
-            "v4_result": result_v4["mapped_result"],
-            "raw_text_v2": result_v2.get("raw_text", ""),
-            "raw_text_v3": result_v3.get("raw_text", ""),
-            "raw_text_v4": result_v4.get("raw_text", "")
+            "v2_result": result_v2,
+            "v3_result": result_v3,
+            "v4_result": result_v4,
+            "raw_text_v2": text_all,
+            "raw_text_v3": text_all,
+            "raw_text_v4": text_all
         }
 
     def batch_extract_advanced(self, folder_path: str) -> List[Dict]:
         """Extract data from all images in folder"""
-        results = []
-        for filename in os.listdir(folder_path):
-            if filename.lower().endswith(".png"):
-                full_path = os.path.join(folder_path, filename)
-                result = self.extract_stat_combined(full_path)
-                results.append(result)
-        return results
+        with os.scandir(folder_path) as entries:
+            image_paths = [entry.path for entry in entries
+                           if entry.name.lower().endswith(".png") and entry.is_file()]
+
+        # Images already in the in-memory cache are not sent to the pool; the rest
+        # are OCR'd across processes and their text is merged back into this
+        # extractor's cache, so a repeat call on the same folder OCRs nothing
+        keys = {path: self._ocr_cache_key(path) for path in image_paths}
+        misses = [path for path in image_paths if keys[path] is not None and keys[path] not in self._ocr_cache]
+        if len(misses) > 1:
+            max_workers = min(len(misses), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                     initargs=(self,)) as executor:
+                for path, text_all in zip(misses, executor.map(_ocr_one, misses, chunksize=4)):
+                    if text_all is not None:
+                        self._remember(keys[path], text_all)
+
+        # Parsing is cheap; a single miss is OCR'd here without starting a pool
+        return [self.extract_stat_combined(path) for path in image_paths]
 
     def extract_from_clahe_advanced(self) -> List[Dict]:
         """Extract data from CLAHE enhanced images using advanced methods"""
@@ -264,12 +408,15 @@ class TapTapDataExtractor:
         for region in self.regions:
             region_folder = os.path.join(debug_folder, region)
             if os.path.exists(region_folder):
-                for filename in os.listdir(region_folder):
-                    if "clahe_enhanced" in filename and filename.endswith(".png"):
-                        full_path = os.path.join(region_folder, filename)
-                        result = self.extract_stat_combined(full_path)
-                        result["region"] = region
-                        results.append(result)
+                with os.scandir(region_folder) as entries:
+                    clahe_paths = [entry.path for entry in entries
+                                   if "clahe_enhanced" in entry.name and entry.name.endswith(".png")
+                                   and entry.is_file()]
+                for full_path in clahe_paths:
+                    # CLAHE images are rescaled upstream; _prepare_image checks their size
+                    result = self.extract_stat_combined(full_path, preprocess=False)
+                    result["region"] = region
+                    results.append(result)
 
         return results
 
@@ -297,63 +444,78 @@ class ConsensusAnalyzer:
             print("❌ Images folder not found. Please run the continuous monitoring first to generate images.")
             return results
         
+        # Get all PNG files per region up front so the regions can be OCR'd in parallel
+        region_files = {}
         for region in self.regions:
-            print(f"\n🔍 Analyzing {region.upper()} region...")
-            print("-" * 50)
-            
             region_folder = os.path.join(debug_folder, region)
-            if not os.path.exists(region_folder):
-                print(f"❌ Region folder {region} not found")
-                continue
-            
-            # Get all PNG files in the region folder
-            image_files = [f for f in os.listdir(region_folder) if f.endswith('.png')]
-            
-            if not image_files:
-                print(f"❌ No PNG files found in {region}")
-                continue
-            
-            print(f"📁 Found {len(image_files)} debug images")
-            
-            # Extract data from all images using all methods
-            all_results = []
-            for filename in image_files:
-                full_path = os.path.join(region_folder, filename)
-                # Extract processing method from filename (remove common prefix and suffix)
-                processing_method = filename.replace(f'screenshot_20250730_173118_{region}_cropped_', '').replace('.png', '')
+            if os.path.exists(region_folder):
+                with os.scandir(region_folder) as entries:
+                    region_files[region] = [e for e in entries if e.name.endswith('.png') and e.is_file()]
+
+        with ProcessPoolExecutor(max_workers=max(1, len(region_files)), initializer=_init_worker,
+                                 initargs=(self.extractor,)) as executor:
+            ocr_jobs = {
+                region: executor.submit(_ocr_images, [e.path for e in files])
+                for region, files in region_files.items() if files
+            }
+
+            for region in self.regions:
+                print(f"\n🔍 Analyzing {region.upper()} region...")
+                print("-" * 50)
                 
-                # Extract using all three methods
-                result_v2 = self.extractor.extract_lisa_data_v2(full_path)
-                result_v3 = self.extractor.extract_game_stat_v3(full_path)
-                result_v4 = self.extractor.extract_stat_v4(full_path)
+                if region not in region_files:
+                    print(f"❌ Region folder {region} not found")
+                    continue
                 
-                result_entry = {
-                    'file': filename,
-                    'processing_method': processing_method,
-                    'v2': result_v2.get('mapped_result', {}),
-                    'v3': result_v3.get('mapped_result', {}),
-                    'v4': result_v4.get('mapped_result', {}),
-                    'raw_v2': result_v2.get('raw_text', ''),
-                    'raw_v3': result_v3.get('raw_text', ''),
-                    'raw_v4': result_v4.get('raw_text', '')
-                }
+                image_files = region_files[region]
                 
-                all_results.append(result_entry)
+                if not image_files:
+                    print(f"❌ No PNG files found in {region}")
+                    continue
                 
-                # Print individual results
-                print(f"  {processing_method:25} | V2: B:{result_entry['v2'].get('b_value', ''):>3} S:{result_entry['v2'].get('s_value', ''):>3} T:{result_entry['v2'].get('t_value', ''):>2} 👥:{result_entry['v2'].get('people_count', ''):>3} 💰:{result_entry['v2'].get('dollar_amount', '')}")
-                print(f"  {'':25} | V3: B:{result_entry['v3'].get('b_value', ''):>3} S:{result_entry['v3'].get('s_value', ''):>3} T:{result_entry['v3'].get('t_value', ''):>2} 👥:{result_entry['v3'].get('people_count', ''):>3} 💰:{result_entry['v3'].get('dollar_amount', '')}")
-                print(f"  {'':25} | V4: B:{result_entry['v4'].get('b_value', ''):>3} S:{result_entry['v4'].get('s_value', ''):>3} T:{result_entry['v4'].get('t_value', ''):>2} 👥:{result_entry['v4'].get('people_count', ''):>3} 💰:{result_entry['v4'].get('dollar_amount', '')}")
-            
-            # Find consensus for each field
-            consensus_result = self._find_consensus(all_results)
-            results[region] = consensus_result
+                print(f"📁 Found {len(image_files)} debug images")
+                
+                # OCR every variant (one batched Tesseract call per region, run in a worker)
+                texts = ocr_jobs[region].result()
+
+                # Parse the shared OCR text with all three methods
+                all_results = []
+                prefix = f'screenshot_20250730_173118_{region}_cropped_'
+                for entry, text_all in zip(image_files, texts):
+                    filename = entry.name
+                    if text_all is None:
+                        print(f"  ❌ Cannot read image: {filename}")
+                        continue
+                    # Extract processing method from filename (remove common prefix and suffix)
+                    processing_method = filename.removeprefix(prefix).removesuffix('.png')
+
+                    result_entry = {
+                        'file': filename,
+                        'processing_method': processing_method,
+                        'v2': self.extractor._parse_v2(text_all),
+                        'v3': self.extractor._parse_v3(text_all),
+                        'v4': self.extractor._parse_v4(text_all),
+                        'raw_v2': text_all,
+                        'raw_v3': text_all,
+                        'raw_v4': text_all
+                    }
+                    
+                    all_results.append(result_entry)
+                    
+                    # Print individual results
+                    print(f"  {processing_method:25} | V2: B:{result_entry['v2'].get('b_value', ''):>3} S:{result_entry['v2'].get('s_value', ''):>3} T:{result_entry['v2'].get('t_value', ''):>2} 👥:{result_entry['v2'].get('people_count', ''):>3} 💰:{result_entry['v2'].get('dollar_amount', '')}")
+                    print(f"  {'':25} | V3: B:{result_entry['v3'].get('b_value', ''):>3} S:{result_entry['v3'].get('s_value', ''):>3} T:{result_entry['v3'].get('t_value', ''):>2} 👥:{result_entry['v3'].get('people_count', ''):>3} 💰:{result_entry['v3'].get('dollar_amount', '')}")
+                    print(f"  {'':25} | V4: B:{result_entry['v4'].get('b_value', ''):>3} S:{result_entry['v4'].get('s_value', ''):>3} T:{result_entry['v4'].get('t_value', ''):>2} 👥:{result_entry['v4'].get('people_count', ''):>3} 💰:{result_entry['v4'].get('dollar_amount', '')}")
+                
+                # Find consensus for each field
+                consensus_result = self._find_consensus(all_results)
+                results[region] = consensus_result
+                
+                print(f"\n✅ {region.upper()} CONSENSUS RESULT:")
+                print(f"   B: {consensus_result['b_value']:>3} | S: {consensus_result['s_value']:>3} | T: {consensus_result['t_value']:>2} | 👥: {consensus_result['people_count']:>3} | 💰: {consensus_result['dollar_amount']}")
+                print(f"   Best method: {consensus_result['best_method']}")
+                print(f"   Confidence: {consensus_result['confidence']:.1f}%")
             
-            print(f"\n✅ {region.upper()} CONSENSUS RESULT:")
-            print(f"   B: {consensus_result['b_value']:>3} | S: {consensus_result['s_value']:>3} | T: {consensus_result['t_value']:>2} | 👥: {consensus_result['people_count']:>3} | 💰: {consensus_result['dollar_amount']}")
-            print(f"   Best method: {consensus_result['best_method']}")
-            print(f"   Confidence: {consensus_result['confidence']:.1f}%")
-        
         return results
 
     def _find_consensus(self, all_results: List[Dict]) -> Dict:
@@ -362,27 +524,27 @@ class ConsensusAnalyzer:
         """
         consensus = {}
         
-        # Collect all values for each field and method
-        field_values = defaultdict(lambda: defaultdict(list))
+        # Count values per field, and how many values each method produced per field
+        field_counts = {field: Counter() for field in self.fields}
+        method_counts = {method: Counter() for method in ['v2', 'v3', 'v4']}
         
-        for result in all_results:
-            for method in ['v2', 'v3', 'v4']:
+        # Method-major order (all v2 values, then v3, then v4): most_common breaks
+        # ties by first insertion, so this order decides tied fields
+        for method in ['v2', 'v3', 'v4']:
+            for result in all_results:
                 for field in self.fields:
                     value = result[method].get(field, '')
                     if value:  # Only count non-empty values
-                        field_values[field][method].append(value)
+                        field_counts[field][value] += 1
+                        method_counts[method][field] += 1
         
         # Find most common value for each field
         for field in self.fields:
-            all_values = []
-            for method in ['v2', 'v3', 'v4']:
-                all_values.extend(field_values[field][method])
+            value_counts = field_counts[field]
             
-            if all_values:
-                # Count frequency of each value
-                value_counts = Counter(all_values)
+            if value_counts:
                 most_common_value, count = value_counts.most_common(1)[0]
-                total_count = len(all_values)
+                total_count = sum(value_counts.values())
                 confidence = (count / total_count) * 100
                 
                 consensus[field] = most_common_value
@@ -397,18 +559,9 @@ class ConsensusAnalyzer:
         
         # Determine best method based on overall confidence
         method_scores = {}
-        for method in ['v2', 'v3', 'v4']:
-            method_score = 0
-            method_total = 0
-            for field in self.fields:
-                if field_values[field][method]:
-                    method_score += len(field_values[field][method])
-                    method_total += 1
-            
-            if method_total > 0:
-                method_scores[method] = method_score / method_total
-            else:
-                method_scores[method] = 0
+        for method, counts in method_counts.items():
+            # Average number of values per field the method produced anything for
+            method_scores[method] = sum(counts.values()) / len(counts) if counts else 0
         
         best_method = max(method_scores, key=method_scores.get)
         overall_confidence = sum(consensus[f'{field}_confidence'] for field in self.fields) / len(self.fields)
@@ -454,33 +607,30 @@ class ConsensusAnalyzer:
         Save consensus results to CSV file.
         """
         csv_filename = "consensus_results.csv"
-        
+
         with open(csv_filename, 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['region', 'b_value', 'b_confidence', 's_value', 's_confidence', 
-                         't_value', 't_confidence', 'people_count', 'people_confidence',
-                         'dollar_amount', 'dollar_confidence', 'best_method', 'overall_confidence']
-            
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for region, consensus in results.items():
-                row = {
-                    'region': region,
-                    'b_value': consensus['b_value'],
-                    'b_confidence': f"{consensus['b_value_confidence']:.1f}%",
-                    's_value': consensus['s_value'],
-                    's_confidence': f"{consensus['s_value_confidence']:.1f}%",
-                    't_value': consensus['t_value'],
-                    't_confidence': f"{consensus['t_value_confidence']:.1f}%",
-                    'people_count': consensus['people_count'],
-                    'people_confidence': f"{consensus['people_count_confidence']:.1f}%",
-                    'dollar_amount': consensus['dollar_amount'],
-                    'dollar_confidence': f"{consensus['dollar_amount_confidence']:.1f}%",
-                    'best_method': consensus['best_method'],
-                    'overall_confidence': f"{consensus['confidence']:.1f}%"
-                }
-                writer.writerow(row)
-        
+            header = ('region', 'b_value', 'b_confidence', 's_value', 's_confidence',
+                      't_value', 't_confidence', 'people_count', 'people_confidence',
+                      'dollar_amount', 'dollar_confidence', 'best_method', 'overall_confidence')
+
+            # Rows are built as plain tuples so csv.writer can emit them directly
+            rows = [
+                (
+                    region,
+                    consensus['b_value'], f"{consensus['b_value_confidence']:.1f}%",
+                    consensus['s_value'], f"{consensus['s_value_confidence']:.1f}%",
+                    consensus['t_value'], f"{consensus['t_value_confidence']:.1f}%",
+                    consensus['people_count'], f"{consensus['people_count_confidence']:.1f}%",
+                    consensus['dollar_amount'], f"{consensus['dollar_amount_confidence']:.1f}%",
+                    consensus['best_method'], f"{consensus['confidence']:.1f}%"
+                )
+                for region, consensus in results.items()
+            ]
+
+            writer = csv.writer(csvfile)
+            writer.writerow(header)
+            writer.writerows(rows)
+
         print(f"💾 Results saved to {csv_filename}")
 
     def get_consensus_results(self) -> Dict:
@@ -549,6 +699,8 @@ class OptimizedConsensusAnalyzer(ConsensusAnalyzer):
             # 'adaptive2_binarized': 18, # Alternative method
             'processed_17': 19       # Custom method (lowest priority)
         }
+        # All method names in one pattern so each filename is scanned once
+        self._method_re = re.compile('|'.join(re.escape(method) for method in self.method_priority))
     
     def analyze_debug_images_consensus_optimized(self, sample_size: int = 5, confidence_threshold: float = 80.0) -> Dict:
         """
@@ -565,150 +717,205 @@ class OptimizedConsensusAnalyzer(ConsensusAnalyzer):
             print("❌ Images folder not found. Please run the continuous monitoring first to generate images.")
             return results
         
+        # Get all PNG files and take only the top N most promising images (by processing method)
+        region_files = {}
         for region in self.regions:
-            print(f"\n🔍 Analyzing {region.upper()} region (optimized)...")
-            print("-" * 50)
-            
             region_folder = os.path.join(debug_folder, region)
-            if not os.path.exists(region_folder):
-                print(f"❌ Region folder {region} not found")
-                continue
-            
-            # Get all PNG files and prioritize them
-            image_files = [f for f in os.listdir(region_folder) if f.endswith('.png')]
-            
-            if not image_files:
-                print(f"❌ No PNG files found in {region}")
-                continue
-            
-            print(f"📁 Found {len(image_files)} debug images")
-            
-            # Prioritize images by processing method (most promising first)
-            prioritized_files = self._prioritize_images_by_method(image_files)
-            
-            # Take only the top N most promising images
-            selected_files = prioritized_files[:sample_size]
-            print(f"🎯 Processing top {len(selected_files)} most promising images")
-            
-            # Process selected images with early termination
-            consensus_result = self._process_images_with_early_termination(
-                region_folder, selected_files, region, confidence_threshold
-            )
-            
-            results[region] = consensus_result
-            
-            print(f"\n✅ {region.upper()} OPTIMIZED CONSENSUS RESULT:")
-            print(f"   B: {consensus_result['b_value']:>3} | S: {consensus_result['s_value']:>3} | T: {consensus_result['t_value']:>2} | 👥: {consensus_result['people_count']:>3} | 💰: {consensus_result['dollar_amount']}")
-            print(f"   Best method: {consensus_result['best_method']}")
-            print(f"   Confidence: {consensus_result['confidence']:.1f}%")
-            print(f"   Images processed: {consensus_result['images_processed']}/{len(image_files)}")
+            if os.path.exists(region_folder):
+                with os.scandir(region_folder) as entries:
+                    image_files = [e.name for e in entries if e.name.endswith('.png') and e.is_file()]
+                region_files[region] = (image_files, self._prioritize_images_by_method(image_files, limit=sample_size))
+
+        # For larger samples, OCR the selected images in worker processes while the
+        # main process tallies them in order; at most max_workers images are in flight
+        max_workers = os.cpu_count() or 1
+        largest_sample = max((len(selected) for _, selected in region_files.values()), default=0)
+        if largest_sample >= _POOL_MIN_IMAGES:
+            pool = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                       initargs=(self.extractor,))
+        else:
+            pool = contextlib.nullcontext()
+        with pool as executor:
+            for region in self.regions:
+                print(f"\n🔍 Analyzing {region.upper()} region (optimized)...")
+                print("-" * 50)
+                
+                region_folder = os.path.join(debug_folder, region)
+                if region not in region_files:
+                    print(f"❌ Region folder {region} not found")
+                    continue
+                
+                image_files, selected_files = region_files[region]
+                
+                if not image_files:
+                    print(f"❌ No PNG files found in {region}")
+                    continue
+                
+                print(f"📁 Found {len(image_files)} debug images")
+                print(f"🎯 Processing top {len(selected_files)} most promising images")
+                
+                # Process selected images with early termination
+                consensus_result = self._process_images_with_early_termination(
+                    region_folder, selected_files, region, confidence_threshold, executor, max_workers
+                )
+                
+                results[region] = consensus_result
+                
+                print(f"\n✅ {region.upper()} OPTIMIZED CONSENSUS RESULT:")
+                print(f"   B: {consensus_result['b_value']:>3} | S: {consensus_result['s_value']:>3} | T: {consensus_result['t_value']:>2} | 👥: {consensus_result['people_count']:>3} | 💰: {consensus_result['dollar_amount']}")
+                print(f"   Best method: {consensus_result['best_method']}")
+                print(f"   Confidence: {consensus_result['confidence']:.1f}%")
+                print(f"   Images processed: {consensus_result['images_processed']}/{len(image_files)}")
         
         return results
 
-    def _prioritize_images_by_method(self, image_files: List[str]) -> List[str]:
+    def _prioritize_images_by_method(self, image_files: Iterable[str], limit: Optional[int] = None) -> List[str]:
         """
         Prioritize images based on processing method effectiveness.
-        Returns sorted list of filenames with most promising methods first.
+        Returns sorted list of filenames with most promising methods first,
+        truncated to the first `limit` entries when a limit is given.
         """
         def get_priority(filename):
-            # Extract method name from filename
-            for method in self.method_priority:
-                if method in filename:
-                    return self.method_priority[method]
-            return 999  # Unknown method gets lowest priority
+            # Best priority among the method names in the filename
+            # (unknown method gets lowest priority)
+            return min(map(self.method_priority.get, self._method_re.findall(filename)), default=999)
         
-        # Sort by priority (lower number = higher priority)
-        return sorted(image_files, key=get_priority)
-
-    def _process_images_with_early_termination(self, region_folder: str, image_files: List[str], region: str, confidence_threshold: float) -> Dict:
+        # Sort by priority (lower number = higher priority); with a limit only
+        # the best `limit` files are kept, which avoids a full sort
+        if limit is None:
+            return sorted(image_files, key=get_priority)
+        return heapq.nsmallest(limit, image_files, key=get_priority)
+
+    def _process_images_with_early_termination(self, region_folder: str, image_files: List[str], region: str,
+                                               confidence_threshold: float, executor: Optional[Executor] = None,
+                                               max_in_flight: int = 1) -> Dict:
         """
         Process images with early termination when confidence threshold is reached.
+        If executor is given, up to max_in_flight images are OCR'd ahead of the one
+        being tallied; pending OCR jobs are cancelled on early termination.
         """
-        field_values = defaultdict(list)
+        field_counts = {field: Counter() for field in self.fields}
         images_processed = 0
+        prefix = f'screenshot_20250730_173118_{region}_cropped_'
+        paths = [os.path.join(region_folder, filename) for filename in image_files]
         
-        for filename in image_files:
-            full_path = os.path.join(region_folder, filename)
-            processing_method = filename.replace(f'screenshot_20250730_173118_{region}_cropped_', '').replace('.png', '')
+        # Bounded window of OCR futures; the next image is submitted as each result is consumed
+        ocr_jobs = deque()
+        unsubmitted = iter(paths)
+        def submit_next():
+            path = next(unsubmitted, None)
+            if path is not None:
+                ocr_jobs.append(executor.submit(_ocr_one, path))
+        if executor is not None:
+            for _ in range(max(1, max_in_flight)):
+                submit_next()
+        
+        for filename, full_path in zip(image_files, paths):
+            processing_method = filename.removeprefix(prefix).removesuffix('.png')
             
             print(f"  Processing: {processing_method}")
             
-            # Extract using all three methods
-            result_v2 = self.extractor.extract_lisa_data_v2(full_path)
-            result_v3 = self.extractor.extract_game_stat_v3(full_path)
-            result_v4 = self.extractor.extract_stat_v4(full_path)
-            
-            # Collect all values
-            for method_result in [result_v2, result_v3, result_v4]:
-                mapped_result = method_result.get('mapped_result', {})
-                for field in self.fields:
-                    value = mapped_result.get(field, '')
-                    if value:
-                        field_values[field].append(value)
+            # OCR once, then parse the same text with all three methods
+            if executor is not None:
+                text_all = ocr_jobs.popleft().result()
+                submit_next()
+            else:
+                text_all = self.extractor._ocr_path(full_path)
+            if text_all is not None:
+                for mapped_result in (self.extractor._parse_v2(text_all),
+                                      self.extractor._parse_v3(text_all),
+                                      self.extractor._parse_v4(text_all)):
+                    for field in self.fields:
+                        value = mapped_result[field]
+                        if value:
+                            field_counts[field][value] += 1
             
             images_processed += 1
             
             # Check if we have enough confidence to stop early
-            current_confidence = self._calculate_current_confidence(field_values)
+            current_confidence = self._calculate_current_confidence(field_counts)
             print(f"    Current confidence: {current_confidence:.1f}%")
             
+            remaining = len(image_files) - images_processed
             if current_confidence >= confidence_threshold:
                 print(f"    ✅ Early termination: confidence {current_confidence:.1f}% >= {confidence_threshold}%")
-                break
+            elif remaining and self._consensus_is_settled(field_counts, remaining):
+                print(f"    ✅ Early termination: remaining {remaining} images cannot change any winner")
+            else:
+                continue
+            for job in ocr_jobs:
+                job.cancel()
+            break
         
         # Calculate final consensus
-        consensus = self._calculate_consensus_from_values(field_values)
+        consensus = self._calculate_consensus_from_values(field_counts)
         consensus['images_processed'] = images_processed
         
         return consensus
 
-    def _calculate_current_confidence(self, field_values: Dict) -> float:
+    def _consensus_is_settled(self, field_counts: Dict[str, Counter], remaining_images: int) -> bool:
+        """
+        True when no field's most common value can be overtaken by the remaining
+        images (each image adds at most one vote per method: v2, v3 and v4).
+        """
+        max_new_votes = 3 * remaining_images
+        for field in self.fields:
+            top = field_counts[field].most_common(2)
+            if not top:
+                return False
+            runner_up = top[1][1] if len(top) > 1 else 0
+            if top[0][1] - runner_up <= max_new_votes:
+                return False
+        return True
+
+    def _calculate_current_confidence(self, field_counts: Dict[str, Counter]) -> float:
         """
-        Calculate current confidence based on collected values.
+        Calculate current confidence based on collected value counts.
         """
-        if not field_values:
+        if not field_counts:
             return 0.0
         
         total_confidence = 0
         for field in self.fields:
-            values = field_values[field]
-            if values:
+            value_counts = field_counts[field]
+            if value_counts:
                 # Count most common value
-                value_counts = Counter(values)
                 most_common_count = value_counts.most_common(1)[0][1]
-                field_confidence = (most_common_count / len(values)) * 100
+                field_confidence = (most_common_count / sum(value_counts.values())) * 100
                 total_confidence += field_confidence
         
         return total_confidence / len(self.fields)
 
-    def _calculate_consensus_from_values(self, field_values: Dict) -> Dict:
+    def _calculate_consensus_from_values(self, field_counts: Dict[str, Counter]) -> Dict:
         """
-        Calculate consensus from collected field values.
+        Calculate consensus from collected field value counts.
         """
         consensus = {}
+        confidences = []
         
         for field in self.fields:
-            values = field_values[field]
-            if values:
-                value_counts = Counter(values)
+            value_counts = field_counts[field]
+            if value_counts:
+                # most_common keeps the first-seen value on ties
                 most_common_value, count = value_counts.most_common(1)[0]
-                total_count = len(values)
-                confidence = (count / total_count) * 100
+                total_count = sum(value_counts.values())
                 
+                confidence = 100.0 * count / total_count
                 consensus[field] = most_common_value
                 consensus[f'{field}_confidence'] = confidence
                 consensus[f'{field}_count'] = count
                 consensus[f'{field}_total'] = total_count
+                confidences.append(confidence)
             else:
                 consensus[field] = ''
                 consensus[f'{field}_confidence'] = 0
                 consensus[f'{field}_count'] = 0
                 consensus[f'{field}_total'] = 0
+                confidences.append(0.0)
         
         # Determine best method (simplified for optimization)
         consensus['best_method'] = 'v3'  # Default to v3 as it's usually most reliable
-        overall_confidence = sum(consensus[f'{field}_confidence'] for field in self.fields) / len(self.fields)
-        consensus['confidence'] = overall_confidence
+        consensus['confidence'] = sum(confidences) / len(confidences)
         
         return consensus
 
@@ -751,89 +958,112 @@ class OptimizedConsensusAnalyzer(ConsensusAnalyzer):
             print()
 
 
+# Per-process extractor used by ProcessPoolExecutor workers
+_worker_extractor = None
+
+
+def _init_worker(extractor: TapTapDataExtractor) -> None:
+    """Store a copy of the parent's extractor in the worker process."""
+    global _worker_extractor
+    _worker_extractor = extractor
+
+
+def _ocr_images(image_paths: List[str]) -> List[Optional[str]]:
+    """Worker entry point: OCR text for a group of images."""
+    return _worker_extractor._ocr_paths(image_paths)
+
+
+def _ocr_one(image_path: str) -> Optional[str]:
+    """Worker entry point: OCR text for a single image."""
+    return _worker_extractor._ocr_path(image_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_extractor(disk_cache_path: Optional[str] = None) -> TapTapDataExtractor:
+    """Extractor reused by the convenience functions (one per cache setting)."""
+    return TapTapDataExtractor(disk_cache_path)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_analyzer(disk_cache_path: Optional[str] = None) -> ConsensusAnalyzer:
+    """Consensus analyzer reused by the convenience functions."""
+    return ConsensusAnalyzer(_shared_extractor(disk_cache_path))
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_optimized_analyzer(disk_cache_path: Optional[str] = None) -> OptimizedConsensusAnalyzer:
+    """Optimized consensus analyzer reused by the convenience functions."""
+    return OptimizedConsensusAnalyzer(_shared_extractor(disk_cache_path))
+
+
 # Convenience functions for backward compatibility
 def extract_lisa_data_v2(image_path: str) -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    return extractor.extract_lisa_data_v2(image_path)
+    return _shared_extractor().extract_lisa_data_v2(image_path)
 
 def extract_game_stat_v3(image_path: str) -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    return extractor.extract_game_stat_v3(image_path)
+    return _shared_extractor().extract_game_stat_v3(image_path)
 
 def extract_stat_v4(image_path: str) -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    return extractor.extract_stat_v4(image_path)
+    return _shared_extractor().extract_stat_v4(image_path)
 
 def extract_stat_combined(image_path: str) -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    return extractor.extract_stat_combined(image_path)
+    return _shared_extractor().extract_stat_combined(image_path)
 
 def batch_extract_advanced(folder_path: str) -> List[Dict]:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    return extractor.batch_extract_advanced(folder_path)
+    return _shared_extractor().batch_extract_advanced(folder_path)
 
 def extract_from_clahe_advanced() -> List[Dict]:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    return extractor.extract_from_clahe_advanced()
+    return _shared_extractor().extract_from_clahe_advanced()
 
 def analyze_debug_images_consensus() -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = ConsensusAnalyzer(extractor)
+    analyzer = _shared_analyzer(DEBUG_OCR_CACHE_PATH)
     return analyzer.analyze_debug_images_consensus()
 
 def find_consensus(all_results: List[Dict]) -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = ConsensusAnalyzer(extractor)
+    analyzer = _shared_analyzer()
     return analyzer._find_consensus(all_results)
 
 def generate_consensus_report() -> None:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = ConsensusAnalyzer(extractor)
+    analyzer = _shared_analyzer(DEBUG_OCR_CACHE_PATH)
     analyzer.generate_consensus_report()
 
 def save_consensus_to_csv(results: Dict) -> None:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = ConsensusAnalyzer(extractor)
+    analyzer = _shared_analyzer()
     analyzer._save_consensus_to_csv(results)
 
 def get_consensus_results() -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = ConsensusAnalyzer(extractor)
+    analyzer = _shared_analyzer(DEBUG_OCR_CACHE_PATH)
     return analyzer.get_consensus_results()
 
 def print_simple_consensus() -> None:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = ConsensusAnalyzer(extractor)
+    analyzer = _shared_analyzer(DEBUG_OCR_CACHE_PATH)
     analyzer.print_simple_consensus()
 
 def analyze_debug_images_consensus_optimized(sample_size: int = 5, confidence_threshold: float = 80.0) -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = OptimizedConsensusAnalyzer(extractor)
+    analyzer = _shared_optimized_analyzer(DEBUG_OCR_CACHE_PATH)
     return analyzer.analyze_debug_images_consensus_optimized(sample_size, confidence_threshold)
 
 def get_consensus_results_optimized(sample_size: int = 5, confidence_threshold: float = 80.0) -> Dict:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = OptimizedConsensusAnalyzer(extractor)
+    analyzer = _shared_optimized_analyzer(DEBUG_OCR_CACHE_PATH)
     return analyzer.get_consensus_results_optimized(sample_size, confidence_threshold)
 
 def print_optimized_consensus(sample_size: int = 5, confidence_threshold: float = 80.0) -> None:
     """Convenience function for backward compatibility."""
-    extractor = TapTapDataExtractor()
-    analyzer = OptimizedConsensusAnalyzer(extractor)
+    analyzer = _shared_optimized_analyzer(DEBUG_OCR_CACHE_PATH)
     analyzer.print_optimized_consensus(sample_size, confidence_threshold)
 
 
@@ -843,9 +1073,8 @@ def main():
     print("=" * 60)
     
     # Create extractor and analyzer instances
-    extractor = TapTapDataExtractor()
+    extractor = TapTapDataExtractor(DEBUG_OCR_CACHE_PATH)
     analyzer = ConsensusAnalyzer(extractor)
-    optimized_analyzer = OptimizedConsensusAnalyzer(extractor)
     
     # Extract from original cropped images
     print("\n📁 Extracting from original cropped images...")
@@ -857,14 +1086,19 @@ def main():
             print(f"Found {len(original_results)} cropped images")
             for result in original_results:
                 m = result['final_result']
-                print(f"{result['file']:45} | B:{m['b_value']:>3} | S:{m['s_value']:>3} | T:{m['t_value']:>2} | 👥:{m['people_count']:>3} | 💰:{m['dollar_amount']}")
-                print(f"   V2: B:{m['b_value']:>3} S:{m['s_value']:>3} T:{m['t_value']:>2} 👥:{m['people_count']:>3} 💰:{m['dollar_amount']}")
-                print(f"   V3: B:{m['b_value']:>3} S:{m['s_value']:>3} T:{m['t_value']:>2} 👥:{m['people_count']:>3} 💰:{m['dollar_amount']}")
-                print(f"   V4: B:{m['b_value']:>3} S:{m['s_value']:>3} T:{m['t_value']:>2} 👥:{m['people_count']:>3} 💰:{m['dollar_amount']}")
-                print(f"   Raw V2: '{result.get('raw_text_v2', '')[:50]}...'")
-                print(f"   Raw V3: '{result.get('raw_text_v3', '')[:50]}...'")
-                print(f"   Raw V4: '{result.get('raw_text_v4', '')[:50]}...'")
-                print()
+                v2, v3, v4 = result['v2_result'], result['v3_result'], result['v4_result']
+                # Build the whole block first so each image costs a single write
+                lines = [
+                    f"{result['file']:45} | B:{m['b_value']:>3} | S:{m['s_value']:>3} | T:{m['t_value']:>2} | 👥:{m['people_count']:>3} | 💰:{m['dollar_amount']}",
+                    f"   V2: B:{v2['b_value']:>3} S:{v2['s_value']:>3} T:{v2['t_value']:>2} 👥:{v2['people_count']:>3} 💰:{v2['dollar_amount']}",
+                    f"   V3: B:{v3['b_value']:>3} S:{v3['s_value']:>3} T:{v3['t_value']:>2} 👥:{v3['people_count']:>3} 💰:{v3['dollar_amount']}",
+                    f"   V4: B:{v4['b_value']:>3} S:{v4['s_value']:>3} T:{v4['t_value']:>2} 👥:{v4['people_count']:>3} 💰:{v4['dollar_amount']}",
+                    f"   Raw V2: '{result.get('raw_text_v2', '')[:50]}...'",
+                    f"   Raw V3: '{result.get('raw_text_v3', '')[:50]}...'",
+                    f"   Raw V4: '{result.get('raw_text_v4', '')[:50]}...'",
+                    ""
+                ]
+                sys.stdout.write("\n".join(lines) + "\n")
     
     # Extract from CLAHE enhanced images
     print("\n📁 Extracting from CLAHE enhanced images...")
@@ -7,20 +7,64 @@ This module contains shared browser initialization and navigation logic
 used across different parts of the TapTap analysis system.
 """
 
-import time
+import os
 from playwright.sync_api import sync_playwright
 
+GAME_URL = "https://bpcdf.vesnamex777.com/player/webMain.jsp?dm=1&title=1"
 
-def initialize_browser_and_navigate():
+# Saved cookies/local storage of a logged-in session, reused on warm starts
+AUTH_STATE_PATH = "auth.json"
+
+# Element only present once the game has loaded for a logged-in player (the game
+# renders into a canvas; an expired session lands on a login page without one)
+GAME_READY_SELECTOR = "canvas"
+
+
+def _wait_until_idle(page, timeout_ms):
+    """Wait for the network to go idle, but never longer than timeout_ms."""
+    try:
+        page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except Exception:
+        pass
+
+
+def initialize_browser_and_navigate(storage_state_path=AUTH_STATE_PATH):
     """
     Initialize browser and navigate to the TapTap game page.
     
+    If storage_state_path holds a saved session, the login flow is skipped and
+    the game page is opened directly; otherwise the session is saved there
+    after logging in. Pass None to always log in from scratch.
+    
     Returns:
         tuple: (browser, page) or (None, None) if initialization fails
     """
     try:
         p = sync_playwright().start()
         browser = p.chromium.launch(headless=False)
+
+        if storage_state_path and os.path.exists(storage_state_path):
+            context = None
+            try:
+                print("  → Reusing saved session...")
+                context = browser.new_context(storage_state=storage_state_path)
+                page = context.new_page()
+                page.goto(GAME_URL, timeout=30000)
+                # An expired session does not raise, it just shows the login page
+                page.wait_for_selector(GAME_READY_SELECTOR, state="attached", timeout=15000)
+                _wait_until_idle(page, 10000)
+                print("  ✅ Browser initialized and game page loaded")
+                return browser, page
+            except Exception as e:
+                print(f"  → Saved session failed ({e}), logging in again...")
+                if context is not None:
+                    context.close()
+                # Drop the stale state so a failed login cannot leave it behind
+                try:
+                    os.remove(storage_state_path)
+                except OSError:
+                    pass
+
         context = browser.new_context()
         page = context.new_page()
 
@@ -55,8 +99,8 @@ def initialize_browser_and_navigate():
         page.fill("//input[@aria-label='Mật Khẩu']", "Tester123456")
         page.locator("xpath=//button[@data-content-name='Log In - Options - (MK-CTA)']").click()
 
-        # Wait and close
-        time.sleep(20)
+        # Wait for the login to settle (bounded by the old fixed delay)
+        _wait_until_idle(page, 20000)
 
         # Click agree to accept currency (with error handling)
         try:
@@ -66,11 +110,18 @@ def initialize_browser_and_navigate():
         except:
             print("  → No dialog found, continuing...")
 
-        time.sleep(10)
+        _wait_until_idle(page, 10000)
+        
+        # Keep the logged-in session for the next start
+        if storage_state_path:
+            try:
+                context.storage_state(path=storage_state_path)
+            except Exception as e:
+                print(f"  → Could not save session: {e}")
         
         # Navigate to game page with error handling
         try:
-            page.goto("https://bpcdf.vesnamex777.com/player/webMain.jsp?dm=1&title=1", timeout=30000)
+            page.goto(GAME_URL, timeout=30000)
             page.wait_for_timeout(10000)
         except Exception as e:
             print(f"  → Navigation error: {e}")
@@ -84,13 +135,19 @@ def initialize_browser_and_navigate():
         return None, None
 
 
-def take_screenshot(page, images_dir="images"):
+def take_screenshot(page, images_dir="images", full_page=False, clip=None, timestamp=None):
     """
     Take a screenshot using the provided page object.
     
+    The crop regions all lie inside the default 1280x720 viewport, so only the
+    viewport is captured unless full_page is set.
+    
     Args:
         page: Playwright page object
         images_dir: Directory to save screenshots (default: "images")
+        full_page: Capture the whole scrollable page instead of the viewport
+        clip: Optional {"x", "y", "width", "height"} area to capture instead
+        timestamp: Name suffix to use instead of the current time
     
     Returns:
         str: Path to the saved screenshot
@@ -101,7 +158,50 @@ def take_screenshot(page, images_dir="images"):
     # Ensure images directory exists
     Path(images_dir).mkdir(exist_ok=True)
     
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if timestamp is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     screenshot_path = f"{images_dir}/screenshot_{timestamp}.png"
-    page.screenshot(path=screenshot_path, full_page=True)
+    if clip:
+        page.screenshot(path=screenshot_path, clip=clip)
+    else:
+        page.screenshot(path=screenshot_path, full_page=full_page)
     return screenshot_path
+
+
+class ScreenshotSession:
+    """
+    Context manager that keeps one logged-in browser page open for many screenshots.
+    
+    Chromium startup and login are paid once on entry; each take() only captures.
+    If the browser could not be started, page is None after entering.
+    Screenshots are named screenshot_<session start>-<index>.png, so captures
+    within the same second never overwrite each other.
+    """
+
+    def __init__(self, images_dir="images", clip=None, storage_state_path=AUTH_STATE_PATH):
+        self.images_dir = images_dir
+        self.clip = clip
+        self.storage_state_path = storage_state_path
+        self.browser = None
+        self.page = None
+        self._started = None
+        self._count = 0
+
+    def __enter__(self):
+        from datetime import datetime
+        self._started = datetime.now().strftime("%Y%m%d_%H%M%S")
+        self._count = 0
+        self.browser, self.page = initialize_browser_and_navigate(self.storage_state_path)
+        return self
+
+    def take(self):
+        """Take one screenshot with the session's page and return its path"""
+        self._count += 1
+        # '-' rather than '_' keeps the "<date>_<time>_<region>" crop name layout intact
+        timestamp = f"{self._started}-{self._count:04d}"
+        return take_screenshot(self.page, self.images_dir, clip=self.clip, timestamp=timestamp)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self.browser:
+            self.browser.close()
+        self.browser = self.page = None
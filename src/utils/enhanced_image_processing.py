@@ -8,23 +8,91 @@ based on Tesseract documentation to improve OCR accuracy.
 """
 
 import cv2
+import functools
+import hashlib
 import numpy as np
-import pytesseract
 import re
 import os
+import tempfile
+import zipfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.tesseract_engine import TesseractEngine
+
+# Digit runs in OCR output
+_RE_NUMBER = re.compile(r'\d+')
+
+
+def _rank_numbers(texts: List[str]) -> List[int]:
+    """
+    Rank the distinct numbers found across OCR texts by how often they occur.
+
+    Args:
+        texts: OCR outputs for the processed variants of one image
+
+    Returns:
+        Distinct numbers, most frequent first; ties keep first-seen order
+    """
+    # One regex pass over the joined texts and a C-level tally instead of a per-text Python loop
+    counter = Counter(map(int, _RE_NUMBER.findall('\n'.join(texts))))
+    return [num for num, _ in counter.most_common()]
+
+
+def load_grayscale(image_path: str) -> Optional[np.ndarray]:
+    """
+    Read an image file as grayscale with cv2.cvtColor, the conversion used for
+    crops handed over in memory (IMREAD_GRAYSCALE can round differently), so a
+    rerun from disk sees the same pixels and result-cache keys as a fresh run.
+    """
+    image = cv2.imread(image_path, cv2.IMREAD_UNCHANGED)
+    if image is None or image.ndim == 2:
+        return image
+    code = cv2.COLOR_BGRA2GRAY if image.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+    return cv2.cvtColor(image, code)
+
+
+# Bump when process_image_comprehensive changes so cached outputs are not reused
+PIPELINE_VERSION = 6
+
+# Width that deskew_image downscales to before edge and line detection
+_DESKEW_WIDTH = 200
+
+# Maximum number of extraction results kept in memory per processor
+_RESULT_CACHE_SIZE = 256
 
 class EnhancedImageProcessor:
-    def __init__(self):
-        """Initialize the enhanced image processor"""
+    def __init__(self, cache_dir: Optional[str] = None, verbose: bool = False):
+        """
+        Initialize the enhanced image processor
+
+        Args:
+            cache_dir: Optional folder where process_image_comprehensive keeps its
+                outputs (one .npz per input image content) for repeat runs
+            verbose: Print per-image progress (sizes, sample counts, numbers found);
+                warnings are always printed
+        """
+        self.cache_dir = cache_dir
+        self.verbose = verbose
+        # extract_data_from_image results keyed by a hash of the crop's pixels
+        self._result_cache = {}
+        # One warm Tesseract handle (digits only); the PSM is switched per pass
+        self.tesseract_psms = (6, 7, 8, 13)
+        self.tesseract_engine = TesseractEngine(psm=self.tesseract_psms[0], whitelist='0123456789')
         self.tesseract_configs = [
-            '--oem 3 --psm 6 -c tessedit_char_whitelist=0123456789',
-            '--oem 3 --psm 7 -c tessedit_char_whitelist=0123456789',
-            '--oem 3 --psm 8 -c tessedit_char_whitelist=0123456789',
-            '--oem 3 --psm 13 -c tessedit_char_whitelist=0123456789'
+            TesseractEngine.build_config(psm, self.tesseract_engine.whitelist) for psm in self.tesseract_psms
         ]
         
+        # Gamma correction as a 256-entry lookup table (same rounding as the float version)
+        gamma = 1.2
+        self.gamma_lut = (np.power(np.arange(256) / 255.0, gamma) * 255.0).astype(np.uint8)
+        
+        # Reused across images; CLAHE.apply keeps no state between calls
+        self.clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
+        self.morph_kernel = np.ones((2, 2), np.uint8)
+        
     def rescale_image(self, image: np.ndarray, target_dpi: int = 300) -> np.ndarray:
         """Rescale image to improve OCR accuracy (Tesseract works best at 300+ DPI)"""
         height, width = image.shape[:2]
@@ -37,7 +105,8 @@ class EnhancedImageProcessor:
         new_width = int(width * scale_factor)
         new_height = int(height * scale_factor)
         
-        rescaled = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_CUBIC)
+        # Bilinear is a quarter of cubic's taps and reads digit glyphs just as well
+        rescaled = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_LINEAR)
         return rescaled
     
     def remove_borders(self, image: np.ndarray, border_size: int = 10) -> np.ndarray:
@@ -52,23 +121,33 @@ class EnhancedImageProcessor:
         return bordered
     
     def apply_binarization(self, image: np.ndarray) -> List[np.ndarray]:
-        """Apply multiple binarization techniques"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        results = []
+        """Apply binarization (a single Sauvola threshold) to a BGR or grayscale image"""
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
         
-        # 1. Otsu thresholding (default Tesseract method)
-        _, otsu = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
-        results.append(otsu)
-        
-        # 2. Adaptive thresholding
-        adaptive = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY, 11, 2)
-        results.append(adaptive)
-        
-        # 3. Adaptive thresholding with different parameters
-        adaptive2 = cv2.adaptiveThreshold(gray, 255, cv2.ADAPTIVE_THRESH_MEAN_C, cv2.THRESH_BINARY, 15, 3)
-        results.append(adaptive2)
-        
-        return results
+        # Sauvola adapts to local contrast like the adaptive mean/gaussian variants
+        # it replaces, at the cost of one integral-image pass
+        return [self.sauvola_threshold(gray)]
+    
+    def sauvola_threshold(self, gray: np.ndarray, window: int = 15, k: float = 0.2,
+                          dynamic_range: float = 128.0) -> np.ndarray:
+        """Binarize with Sauvola's local threshold, using integral images for the window statistics"""
+        height, width = gray.shape[:2]
+        half = window // 2
+        padded = cv2.copyMakeBorder(gray, half, half, half, half, cv2.BORDER_REFLECT)
+        sums, squares = cv2.integral2(padded, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+        
+        # Window sums from the four corners of each window
+        def window_sum(table):
+            return (table[window:window + height, window:window + width] - table[:height, window:window + width]
+                    - table[window:window + height, :width] + table[:height, :width])
+        
+        area = window * window
+        mean = window_sum(sums) / area
+        std = np.sqrt(np.maximum(window_sum(squares) / area - mean * mean, 0))
+        threshold = mean * (1 + k * (std / dynamic_range - 1))
+        
+        # uint8 scalars keep np.where from building an int64 image before the cast
+        return np.where(gray > threshold, np.uint8(255), np.uint8(0))
     
     def remove_noise(self, image: np.ndarray) -> List[np.ndarray]:
         """Apply noise removal techniques"""
@@ -96,8 +175,7 @@ class EnhancedImageProcessor:
         """Apply dilation and erosion operations"""
         results = []
         
-        # Create kernel
-        kernel = np.ones((2, 2), np.uint8)
+        kernel = self.morph_kernel
         
         # 1. Dilation (for thin characters)
         dilated = cv2.dilate(image, kernel, iterations=1)
@@ -122,8 +200,7 @@ class EnhancedImageProcessor:
         results = []
         
         # 1. CLAHE (Contrast Limited Adaptive Histogram Equalization)
-        clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
-        enhanced = clahe.apply(image)
+        enhanced = self.clahe.apply(image)
         results.append(enhanced)
         
         # 2. Histogram equalization
@@ -131,21 +208,26 @@ class EnhancedImageProcessor:
         results.append(equalized)
         
         # 3. Gamma correction
-        gamma = 1.2
-        gamma_corrected = np.power(image / 255.0, gamma) * 255.0
-        gamma_corrected = gamma_corrected.astype(np.uint8)
+        gamma_corrected = cv2.LUT(image, self.gamma_lut)
         results.append(gamma_corrected)
         
         return results
     
-    def deskew_image(self, image: np.ndarray) -> np.ndarray:
-        """Deskew image to make text horizontal"""
+    def deskew_image(self, image: np.ndarray, gray: Optional[np.ndarray] = None) -> np.ndarray:
+        """Deskew image to make text horizontal (gray: optional precomputed grayscale of image)"""
         try:
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            if gray is None:
+                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
+            
+            # Only the angle is needed, and it survives downscaling, so find lines
+            # on a small copy (the vote threshold shrinks with line length)
+            scale = min(1.0, _DESKEW_WIDTH / gray.shape[1])
+            if scale < 1.0:
+                gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
             
             # Find lines using Hough transform
             edges = cv2.Canny(gray, 50, 150, apertureSize=3)
-            lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=100)
+            lines = cv2.HoughLines(edges, 1, np.pi/180, threshold=max(int(100 * scale), 20))
             
             if lines is not None and len(lines) > 0:
                 # Calculate average angle
@@ -169,8 +251,57 @@ class EnhancedImageProcessor:
         
         return image
     
+    def _pipeline_params_key(self) -> bytes:
+        """Processing and engine parameters that shape the cached pipeline outputs"""
+        params = (PIPELINE_VERSION, _DESKEW_WIDTH, self.clahe.getClipLimit(), self.clahe.getTilesGridSize(),
+                  self.morph_kernel.shape, self.tesseract_psms, self.tesseract_engine.whitelist)
+        return repr(params).encode() + self.gamma_lut.tobytes()
+
+    def _pipeline_cache_path(self, image: np.ndarray) -> Optional[Path]:
+        """Cache file for an input image, keyed by its pixels and the pipeline parameters"""
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha256(self._pipeline_params_key() + str(image.shape).encode() + image.tobytes()).hexdigest()
+        return Path(self.cache_dir) / f"{digest}_v{PIPELINE_VERSION}.npz"
+
     def process_image_comprehensive(self, image: np.ndarray) -> List[np.ndarray]:
-        """Apply comprehensive image processing pipeline"""
+        """Apply comprehensive image processing pipeline (cached on disk when cache_dir is set)"""
+        cache_path = self._pipeline_cache_path(image)
+        if cache_path is not None and cache_path.exists():
+            try:
+                with np.load(cache_path) as cached:
+                    return [cached[f'arr_{i}'] for i in range(len(cached.files))]
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+                print(f"    ⚠️ Ignoring unreadable pipeline cache {cache_path.name}: {e}")
+        
+        processed_images, complete = self._run_comprehensive_pipeline(image)
+        
+        # Fallback output is not cached so the next run retries the full pipeline
+        if cache_path is not None and complete:
+            self._write_pipeline_cache(cache_path, processed_images)
+        
+        return processed_images
+    
+    def _write_pipeline_cache(self, cache_path: Path, processed_images: List[np.ndarray]) -> None:
+        """Write the outputs to a temp file next to cache_path, then move it into place"""
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(suffix='.npz.tmp', dir=cache_path.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez_compressed(f, *processed_images)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            print(f"    ⚠️ Could not write pipeline cache {cache_path.name}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+    
+    def _run_comprehensive_pipeline(self, image: np.ndarray) -> Tuple[List[np.ndarray], bool]:
+        """
+        Run every processing step and return all intermediate images, plus
+        False when a step failed and the basic fallback was used instead
+        """
         processed_images = []
         
         # Original image
@@ -185,40 +316,43 @@ class EnhancedImageProcessor:
             bordered = self.remove_borders(rescaled)
             processed_images.append(bordered)
             
-            # 3. Deskew (optional, skip if fails)
-            deskewed = self.deskew_image(bordered)
+            # 3. Deskew (optional, skip if fails); the grayscale is shared with
+            # binarization unless the image was actually rotated
+            bordered_gray = cv2.cvtColor(bordered, cv2.COLOR_BGR2GRAY) if bordered.ndim == 3 else bordered
+            deskewed = self.deskew_image(bordered, gray=bordered_gray)
             processed_images.append(deskewed)
+            if deskewed is bordered:
+                deskewed_gray = bordered_gray
+            else:
+                deskewed_gray = cv2.cvtColor(deskewed, cv2.COLOR_BGR2GRAY) if deskewed.ndim == 3 else deskewed
             
             # 4. Apply different binarization techniques
-            binarized = self.apply_binarization(deskewed)
+            binarized = self.apply_binarization(deskewed_gray)
             processed_images.extend(binarized)
             
-            # 5. Apply noise removal to each binarized image
-            for binarized_img in binarized:
-                denoised = self.remove_noise(binarized_img)
-                processed_images.extend(denoised)
+            # Stages below are flat (one input each) so the variant count stays
+            # fixed instead of multiplying stage by stage
             
-            # 6. Apply morphological operations (limit to avoid too many images)
-            for denoised_img in processed_images[-len(binarized)*2:]:  # Last 2*len(binarized) images
-                morph_ops = self.apply_morphological_operations(denoised_img)
-                processed_images.extend(morph_ops)
+            # 5. Apply noise removal to the binarized image
+            denoised = self.remove_noise(binarized[0])
+            processed_images.extend(denoised)
             
-            # 7. Apply contrast enhancement (limit to avoid too many images)
-            gray_images = [cv2.cvtColor(img, cv2.COLOR_BGR2GRAY) if len(img.shape) == 3 else img 
-                          for img in processed_images[-10:]]  # Last 10 images
+            # 6. Apply morphological operations to the non-local means result
+            processed_images.extend(self.apply_morphological_operations(denoised[-1]))
             
-            for gray_img in gray_images:
-                enhanced = self.enhance_contrast(gray_img)
-                processed_images.extend(enhanced)
+            # 7. Apply contrast enhancement to the grayscale (binary images
+            # have no contrast left to stretch)
+            processed_images.extend(self.enhance_contrast(deskewed_gray))
                 
         except Exception as e:
             print(f"    ⚠️ Image processing failed: {e}")
             # Fallback to basic processing
-            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
             _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             processed_images.append(thresh)
+            return processed_images, False
         
-        return processed_images
+        return processed_images, True
     
     def process_image_optimized(self, image: np.ndarray) -> Dict[str, np.ndarray]:
         """
@@ -230,15 +364,12 @@ class EnhancedImageProcessor:
         processed_images = {}
         
         try:
-            # Convert to grayscale if needed
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image.copy()
+            # Convert to grayscale if needed (every method below writes a new buffer,
+            # so a grayscale input can be used as is)
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
             
             # Method 1: processed_17 (custom method - enhanced with CLAHE + adaptive threshold)
-            clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8,8))
-            clahe_enhanced = clahe.apply(gray)
+            clahe_enhanced = self.clahe.apply(gray)
             processed_17 = cv2.adaptiveThreshold(
                 clahe_enhanced, 255, cv2.ADAPTIVE_THRESH_GAUSSIAN_C, 
                 cv2.THRESH_BINARY, 11, 2
@@ -259,65 +390,100 @@ class EnhancedImageProcessor:
         except Exception as e:
             print(f"    ⚠️ Optimized image processing failed: {e}")
             # Fallback to basic processing
-            if len(image.shape) == 3:
-                gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-            else:
-                gray = image.copy()
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY) if image.ndim == 3 else image
             _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
             processed_images['fallback'] = thresh
         
         return processed_images
     
     def extract_text_from_processed_images(self, processed_images: List[np.ndarray]) -> List[str]:
-        """Extract text from all processed images"""
+        """Extract text from all processed images (one Tesseract batch per PSM)"""
+        # Identical bitmaps give identical text, so OCR each distinct one only once
+        unique_index = {}
+        unique_images = []
+        positions = []
+        for img in processed_images:
+            digest = hashlib.blake2b(str(img.shape).encode() + img.tobytes(), digest_size=8).digest()
+            if digest not in unique_index:
+                unique_index[digest] = len(unique_images)
+                unique_images.append(img)
+            positions.append(unique_index[digest])
+        
+        texts_per_config = []
+        for psm in self.tesseract_psms:
+            self.tesseract_engine.set_psm(psm)
+            try:
+                texts_per_config.append(self.tesseract_engine.images_to_strings(unique_images))
+            except Exception as e:
+                print(f"    ⚠️ OCR failed for PSM {psm}: {e}")
+                texts_per_config.append([''] * len(unique_images))
+        
+        # Keep the image-by-image, config-by-config order (and counts) of the results
+        texts_per_image = list(zip(*texts_per_config))
         all_texts = []
-        
-        for i, img in enumerate(processed_images):
-            for config in self.tesseract_configs:
-                try:
-                    text = pytesseract.image_to_string(img, config=config)
-                    if text.strip():
-                        all_texts.append(text.strip())
-                except Exception as e:
-                    continue
+        for position in positions:
+            for text in texts_per_image[position]:
+                if text.strip():
+                    all_texts.append(text.strip())
         
         return all_texts
     
-    def extract_data_from_image(self, image_path: str) -> Dict[str, any]:
-        """Extract data using enhanced image processing"""
-        # Load image
-        image = cv2.imread(image_path)
+    def extract_data_from_image(self, image_path: str, exhaustive: bool = False) -> Dict[str, any]:
+        """
+        Extract data using enhanced image processing (cached by image content).
+        
+        By default only the three variants of process_image_optimized are OCR'd;
+        pass exhaustive=True for the full process_image_comprehensive cascade.
+        """
+        # Load image (grayscale: every processing path works on a single channel)
+        image = load_grayscale(image_path)
         if image is None:
             return {}
         
+        return self.extract_data_from_array(image, exhaustive)
+    
+    def extract_data_from_array(self, image: np.ndarray, exhaustive: bool = False) -> Dict[str, any]:
+        """Same as extract_data_from_image for a crop already in memory (grayscale preferred)"""
+        # Crops often repeat frame to frame; hashing is far cheaper than the OCR pipeline
+        key = (hashlib.blake2b(str(image.shape).encode() + image.tobytes(), digest_size=8).digest(), exhaustive)
+        cached = self._result_cache.get(key)
+        if cached is not None:
+            if self.verbose:
+                print("    ♻️ Same pixels as an earlier crop, reusing its result")
+            return dict(cached)
+        
+        result = self._extract_data_from_pixels(image, exhaustive)
+        if len(self._result_cache) >= _RESULT_CACHE_SIZE:
+            # Drop the oldest entry (dicts keep insertion order)
+            del self._result_cache[next(iter(self._result_cache))]
+        self._result_cache[key] = result
+        return dict(result)
+    
+    def _extract_data_from_pixels(self, image: np.ndarray, exhaustive: bool = False) -> Dict[str, any]:
+        """Run the processing pipeline and number consensus on a loaded image"""
         # Get image dimensions
         height, width = image.shape[:2]
-        print(f"    📏 Original image size: {width}x{height}")
+        if self.verbose:
+            print(f"    📏 Original image size: {width}x{height}")
         
-        # Apply comprehensive image processing
-        processed_images = self.process_image_comprehensive(image)
-        print(f"    🔧 Generated {len(processed_images)} processed images")
+        # Apply image processing (top variants only unless exhaustive)
+        if exhaustive:
+            processed_images = self.process_image_comprehensive(image)
+        else:
+            processed_images = list(self.process_image_optimized(image).values())
+        if self.verbose:
+            print(f"    🔧 Generated {len(processed_images)} processed images")
         
         # Extract text from all processed images
         all_texts = self.extract_text_from_processed_images(processed_images)
-        print(f"    📝 Extracted {len(all_texts)} text samples")
-        
-        # Extract numbers from all texts
-        numbers = []
-        for text in all_texts:
-            number_matches = re.findall(r'\d+', text)
-            for match in number_matches:
-                try:
-                    numbers.append(int(match))
-                except ValueError:
-                    continue
+        if self.verbose:
+            print(f"    📝 Extracted {len(all_texts)} text samples")
         
         # Find most common numbers
-        from collections import Counter
-        if numbers:
-            counter = Counter(numbers)
-            common_numbers = [num for num, count in counter.most_common() if count >= 1]
-            print(f"    🔢 Found numbers: {common_numbers}")
+        common_numbers = _rank_numbers(all_texts)
+        if common_numbers:
+            if self.verbose:
+                print(f"    🔢 Found numbers: {common_numbers}")
             
             # Map numbers to fields
             if len(common_numbers) >= 5:
@@ -347,48 +513,32 @@ class EnhancedImageProcessor:
 
     def extract_data_from_image_optimized(self, image_path: str) -> Dict[str, any]:
         """Extract data using optimized image processing (only 3 best methods)"""
-        # Load image
-        image = cv2.imread(image_path)
+        # Load image (grayscale: every processing path works on a single channel)
+        image = load_grayscale(image_path)
         if image is None:
             return {}
         
         # Get image dimensions
         height, width = image.shape[:2]
-        print(f"    📏 Original image size: {width}x{height}")
+        if self.verbose:
+            print(f"    📏 Original image size: {width}x{height}")
         
         # Apply optimized image processing (only 3 methods)
         processed_images = self.process_image_optimized(image)
-        print(f"    🔧 Generated {len(processed_images)} optimized processed images")
+        if self.verbose:
+            print(f"    🔧 Generated {len(processed_images)} optimized processed images")
         
         # Extract text from optimized processed images
-        all_texts = []
-        for method_name, processed_img in processed_images.items():
-            for config in self.tesseract_configs:
-                try:
-                    text = pytesseract.image_to_string(processed_img, config=config)
-                    if text.strip():
-                        all_texts.append(text.strip())
-                except Exception as e:
-                    continue
-        
-        print(f"    📝 Extracted {len(all_texts)} text samples")
-        
-        # Extract numbers from all texts
-        numbers = []
-        for text in all_texts:
-            number_matches = re.findall(r'\d+', text)
-            for match in number_matches:
-                try:
-                    numbers.append(int(match))
-                except ValueError:
-                    continue
+        all_texts = self.extract_text_from_processed_images(list(processed_images.values()))
+        
+        if self.verbose:
+            print(f"    📝 Extracted {len(all_texts)} text samples")
         
         # Find most common numbers
-        from collections import Counter
-        if numbers:
-            counter = Counter(numbers)
-            common_numbers = [num for num, count in counter.most_common() if count >= 1]
-            print(f"    🔢 Found numbers: {common_numbers[:20]}...")  # Show first 20
+        common_numbers = _rank_numbers(all_texts)
+        if common_numbers:
+            if self.verbose:
+                print(f"    🔢 Found numbers: {common_numbers[:20]}...")  # Show first 20
             
             # Extract data using the same logic as the original
             if len(common_numbers) >= 5:
@@ -428,54 +578,105 @@ class EnhancedImageProcessor:
             'processing_methods': list(processed_images.keys())
         }
         
-        print(f"    ✅ Extracted data: {result}")
+        if self.verbose:
+            print(f"    ✅ Extracted data: {result}")
         return result
 
-def extract_all_data_enhanced():
-    """Enhanced data extraction using comprehensive image processing"""
-    
-    processor = EnhancedImageProcessor()
+
+@functools.lru_cache(maxsize=None)
+def shared_processor() -> EnhancedImageProcessor:
+    """Processor reused across calls in this process, so its Tesseract handle and result cache stay warm."""
+    return EnhancedImageProcessor()
+
+
+# Per-process processor used by ProcessPoolExecutor workers
+_worker_processor = None
+
+
+def _init_worker() -> None:
+    """Build the worker's own processor (Tesseract handles cannot be shared across processes)."""
+    global _worker_processor
+    _worker_processor = EnhancedImageProcessor()
+
+
+def _extract_with(processor: EnhancedImageProcessor, image_path: str,
+                  image: Optional[np.ndarray] = None) -> Dict[str, any]:
+    """Enhanced extraction for one cropped image (from memory if given)."""
+    if image is not None:
+        return processor.extract_data_from_array(image)
+    return processor.extract_data_from_image(image_path)
+
+
+def _extract_file(image_path: str, image: Optional[np.ndarray] = None) -> Dict[str, any]:
+    """Worker entry point: enhanced extraction for one cropped image."""
+    return _extract_with(_worker_processor, image_path, image)
+
+
+def _collect_results(jobs: List[Tuple[str, str, str]], extracted) -> List[Dict[str, any]]:
+    """Attach file metadata to each extraction result, in job order."""
     all_results = []
+    for (cropped_file, timestamp, region), extracted_data in zip(jobs, extracted):
+        print(f"\n    🔍 Processed: {cropped_file}")
+        iteration = "01"
+        
+        if extracted_data:
+            # Add metadata
+            data = {
+                "timestamp": timestamp,
+                "iteration": iteration,
+                "region": region,
+                "username": region.capitalize(),
+                "filename": cropped_file,
+                **extracted_data
+            }
+            all_results.append(data)
+            print(f"    ✅ Extracted: {extracted_data}")
+        else:
+            print(f"    ❌ Failed to extract data from {cropped_file}")
+    
+    return all_results
+
+
+def extract_all_data_enhanced(crops: Optional[Dict[str, np.ndarray]] = None):
+    """
+    Enhanced data extraction using comprehensive image processing
+    
+    Args:
+        crops: Optional map from cropped file name to its pixels (as returned by
+            full_flow.crop_all_screenshots); those crops are not re-read from disk
+    """
+    crops = crops or {}
     
     # Get all cropped image files
-    cropped_files = []
-    for file in os.listdir("images"):
-        if file.endswith("_cropped.png") and ("daroka" in file or "lexi" in file or "mafer" in file):
-            cropped_files.append(file)
+    with os.scandir("images") as entries:
+        cropped_files = [entry.name for entry in entries
+                         if entry.name.endswith("_cropped.png")
+                         and ("daroka" in entry.name or "lexi" in entry.name or "mafer" in entry.name)]
     
     print(f"  → Found {len(cropped_files)} cropped images to process")
     
+    # Extract timestamp and region from filename
+    jobs = []
     for cropped_file in cropped_files:
-        print(f"\n    🔍 Processing: {cropped_file}")
-        
-        # Extract timestamp and region from filename
         parts = cropped_file.replace(".png", "").split("_")
-        
         if len(parts) >= 4:
             timestamp = f"{parts[1]}_{parts[2]}"
-            iteration = "01"
             region = parts[3]  # daroka, lexi, or mafer
-            
-            # Extract data using enhanced processing
-            image_path = f"images/{cropped_file}"
-            extracted_data = processor.extract_data_from_image(image_path)
-            
-            if extracted_data:
-                # Add metadata
-                data = {
-                    "timestamp": timestamp,
-                    "iteration": iteration,
-                    "region": region,
-                    "username": region.capitalize(),
-                    "filename": cropped_file,
-                    **extracted_data
-                }
-                all_results.append(data)
-                print(f"    ✅ Extracted: {extracted_data}")
-            else:
-                print(f"    ❌ Failed to extract data from {cropped_file}")
+            jobs.append((cropped_file, timestamp, region))
     
-    return all_results
+    image_paths = [f"images/{cropped_file}" for cropped_file, _, _ in jobs]
+    images = [crops.get(cropped_file) for cropped_file, _, _ in jobs]
+    
+    # A single crop is not worth starting a worker process for
+    if len(jobs) <= 1:
+        processor = shared_processor()
+        return _collect_results(jobs, [_extract_with(processor, path, image)
+                                       for path, image in zip(image_paths, images)])
+    
+    # Files are independent, so OCR them in parallel; map keeps the input order
+    with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1),
+                             initializer=_init_worker) as executor:
+        return _collect_results(jobs, executor.map(_extract_file, image_paths, images))
 
 if __name__ == "__main__":
     results = extract_all_data_enhanced()
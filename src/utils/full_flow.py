@@ -14,10 +14,27 @@ from datetime import datetime
 from pathlib import Path
 import cv2
 import csv
+from concurrent.futures import ThreadPoolExecutor
 
 # Import enhanced image processing
 from src.utils.enhanced_image_processing import extract_all_data_enhanced
 
+# Scoreboard regions as (name, x1, y1, x2, y2) in screenshot pixels
+CROP_REGIONS = (
+    ("lexi", 271, 508, 583, 539),
+    ("mafer", 604, 509, 915, 541),
+    ("daroka", 931, 509, 1244, 541)
+)
+
+# Crops are tiny and rewritten every run, so encode them with the fastest zlib settings
+CROP_PNG_PARAMS = [cv2.IMWRITE_PNG_COMPRESSION, 1, cv2.IMWRITE_PNG_STRATEGY, cv2.IMWRITE_PNG_STRATEGY_FIXED]
+
+# Every PNG file starts with this signature
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# Smallest screenshot (height, width) that contains every region
+CROP_MIN_SHAPE = (max(y2 for _, _, _, _, y2 in CROP_REGIONS), max(x2 for _, _, _, x2, _ in CROP_REGIONS))
+
 
 def run_full_flow():
     """Run complete workflow: web automation -> screenshots -> crop -> extract -> CSV"""
@@ -31,11 +48,11 @@ def run_full_flow():
 
     # Step 2: Crop all screenshots
     print("\n✂️ Step 2: Cropping regions from all screenshots...")
-    crop_all_screenshots()
+    crops = crop_all_screenshots()
 
-    # Step 3: Extract data from all cropped images
+    # Step 3: Extract data from all cropped images (fresh crops are not re-read)
     print("\n📝 Step 3: Extracting data from all images...")
-    all_results = extract_all_data_enhanced()
+    all_results = extract_all_data_enhanced(crops)
 
     # Step 4: Save to CSV
     print("\n💾 Step 4: Saving results to CSV...")
@@ -47,76 +64,135 @@ def run_full_flow():
     print(f"📁 Cropped images saved to: images/")
 
 
-def run_web_automation_with_screenshots():
-    """Run web automation and take screenshots every 5 seconds for 10 iterations"""
+def run_web_automation_with_screenshots(iterations=1, interval_seconds=5):
+    """Run web automation and take a screenshot every interval_seconds for the given iterations"""
 
     # Import shared browser utilities
-    from src.utils.browser_utils import initialize_browser_and_navigate, take_screenshot
+    from src.utils.browser_utils import ScreenshotSession
 
-    # Initialize browser and navigate to game page
-    browser, page = initialize_browser_and_navigate()
-    if not browser or not page:
-        print("❌ Failed to initialize browser")
-        return
+    # Only the area holding the crop regions is captured; it starts at the page
+    # origin, so CROP_REGIONS coordinates apply to the smaller image unchanged
+    clip = {"x": 0, "y": 0, "width": CROP_MIN_SHAPE[1], "height": CROP_MIN_SHAPE[0]}
 
-    try:
-        # Take 1 screenshot
-        print("  → Taking 1 screenshot...")
-        screenshot_path = take_screenshot(page)
-        print(f"    📸 Screenshot: {screenshot_path}")
-    finally:
-        browser.close()
+    # One browser and login for every screenshot of the run
+    with ScreenshotSession(clip=clip) as session:
+        if not session.page:
+            print("❌ Failed to initialize browser")
+            return
+
+        print(f"  → Taking {iterations} screenshot(s)...")
+        for i in range(iterations):
+            if i:
+                time.sleep(interval_seconds)
+            screenshot_path = session.take()
+            print(f"    📸 Screenshot: {screenshot_path}")
 
 
 def crop_all_screenshots():
-    """Crop all screenshots in the images folder"""
-
-    # Get all screenshot files
-    screenshot_files = []
-    for file in os.listdir("images"):
-        if file.startswith("screenshot_") and file.endswith(".png"):
-            screenshot_files.append(file)
-
-    print(f"  → Found {len(screenshot_files)} screenshots to crop")
-
-    for screenshot_file in screenshot_files:
-        screenshot_path = f"images/{screenshot_file}"
-        base_name = screenshot_file.replace(".png", "")
-
-        # Load the screenshot
-        img = cv2.imread(screenshot_path)
-        if img is None:
-            print(f"    ❌ Error loading: {screenshot_file}")
-            continue
-
-        # Define crop coordinates for all three regions
-        regions = [
-            ("lexi", 271, 508, 583, 539),
-            ("mafer", 604, 509, 915, 541),
-            ("daroka", 931, 509, 1244, 541)
-        ]
-
-        # Crop each region
-        for name, x1, y1, x2, y2 in regions:
-            # Check bounds to prevent OpenCV errors
-            height, width = img.shape[:2]
-            x1 = max(0, min(x1, width))
-            y1 = max(0, min(y1, height))
-            x2 = max(0, min(x2, width))
-            y2 = max(0, min(y2, height))
-            
-            # Ensure valid crop region
-            if x1 < x2 and y1 < y2:
-                cropped = img[y1:y2, x1:x2]
-                if cropped.size > 0:  # Check if cropped image is not empty
-                    cropped_filename = f"images/{base_name}_{name}_cropped.png"
-                    cv2.imwrite(cropped_filename, cropped)
-                else:
-                    print(f"    ⚠️ Empty crop for {name} in {screenshot_file}")
-            else:
-                print(f"    ⚠️ Invalid crop coordinates for {name} in {screenshot_file}")
-
-        print(f"    ✅ Cropped: {screenshot_file}")
+    """
+    Crop all screenshots in the images folder
+    
+    Returns:
+        dict: Cropped file name -> grayscale crop, so extraction can skip
+        decoding the PNGs that were just written
+    """
+
+    # Get all screenshot files (not the crops, which share the prefix); scandir
+    # entries carry the mtime needed for the up-to-date check
+    with os.scandir("images") as entries:
+        screenshots = [(entry.name, entry.stat().st_mtime) for entry in entries
+                       if entry.name.startswith("screenshot_") and entry.name.endswith(".png")
+                       and not entry.name.endswith("_cropped.png")]
+
+    # Screenshots whose crops were written after them were handled by an earlier run
+    screenshot_files = [name for name, mtime in screenshots if not _crops_up_to_date(name, mtime)]
+
+    print(f"  → Found {len(screenshots)} screenshots, {len(screenshot_files)} to crop")
+
+    # Files are independent and OpenCV releases the GIL while decoding and
+    # encoding, so threads crop several screenshots at once
+    crops = {}
+    with ThreadPoolExecutor(max_workers=os.cpu_count() or 4) as executor:
+        screenshot_paths = [f"images/{screenshot_file}" for screenshot_file in screenshot_files]
+        for screenshot_crops in executor.map(crop_screenshot, screenshot_paths):
+            crops.update(screenshot_crops)
+    return crops
+
+
+def _crops_up_to_date(screenshot_file, screenshot_mtime):
+    """True if every region crop of the screenshot exists and is newer than it"""
+    base_name = screenshot_file[:-len(".png")]
+    for name, _, _, _, _ in CROP_REGIONS:
+        try:
+            if os.path.getmtime(f"images/{base_name}_{name}_cropped.png") < screenshot_mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def crop_screenshot(screenshot_path, verbose=False):
+    """
+    Crop every scoreboard region out of one screenshot into the images folder
+    
+    Args:
+        screenshot_path: Screenshot PNG to crop
+        verbose: Print the image size and one line per region
+    
+    Returns:
+        dict: Cropped file name -> grayscale crop (empty if the screenshot is unusable)
+    """
+    screenshot_file = Path(screenshot_path).name
+    base_name = Path(screenshot_path).stem
+
+    # Empty or garbage files (e.g. from a browser that died mid-capture) are
+    # rejected from their first bytes instead of a failed decode
+    try:
+        with open(screenshot_path, 'rb') as f:
+            is_png = f.read(len(PNG_SIGNATURE)) == PNG_SIGNATURE
+    except OSError:
+        is_png = False
+    if not is_png:
+        print(f"    ❌ Not a PNG file: {screenshot_file}")
+        return {}
+
+    # Load the screenshot
+    img = cv2.imread(screenshot_path)
+    if img is None:
+        print(f"    ❌ Error loading: {screenshot_file}")
+        return {}
+
+    height, width = img.shape[:2]
+    if verbose:
+        print(f"    📏 Image size: {width}x{height}")
+
+    # One bounds check per screenshot covers every region; smaller screenshots
+    # have each region clamped to the image instead
+    needs_clamp = height < CROP_MIN_SHAPE[0] or width < CROP_MIN_SHAPE[1]
+
+    # Crop each region (plain slices, no copies); the files stay on disk for
+    # inspection and later runs, the grayscale copies go straight to extraction.
+    # PNG encoding releases the GIL, so the writes run in parallel, and the pool
+    # is joined before returning because callers read the crops right after
+    crops = {}
+    with ThreadPoolExecutor(max_workers=len(CROP_REGIONS)) as io_pool:
+        for name, x1, y1, x2, y2 in CROP_REGIONS:
+            if needs_clamp:
+                x1, x2 = min(x1, width), min(x2, width)
+                y1, y2 = min(y1, height), min(y2, height)
+                if x1 >= x2 or y1 >= y2:
+                    print(f"    ⚠️ Region {name} is outside {screenshot_file}")
+                    continue
+            cropped = img[y1:y2, x1:x2]
+            cropped_file = f"{base_name}_{name}_cropped.png"
+            io_pool.submit(cv2.imwrite, f"images/{cropped_file}", cropped, CROP_PNG_PARAMS)
+            # Same conversion as load_grayscale, which rereads the PNG on later runs
+            crops[cropped_file] = cv2.cvtColor(cropped, cv2.COLOR_BGR2GRAY)
+            if verbose:
+                print(f"    ✅ Cropped {name}: images/{cropped_file}")
+
+    print(f"    ✅ Cropped: {screenshot_file}")
+    return crops
 
 
 def save_to_csv(all_results):
@@ -132,10 +208,11 @@ def save_to_csv(all_results):
 
     # Save to CSV
     csv_file = "output.csv"
-    with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-        writer = csv.DictWriter(f, fieldnames=columns_order)
-        writer.writeheader()
-        writer.writerows(all_results)
+    with open(csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
+        # Rows are projected to the column order once, so the writer gets plain tuples
+        writer = csv.writer(f)
+        writer.writerow(columns_order)
+        writer.writerows(tuple(result.get(column, "") for column in columns_order) for result in all_results)
 
     print(f"  ✅ Saved {len(all_results)} records to {csv_file}")
 
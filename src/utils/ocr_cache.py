@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+OCR Disk Cache for TapTap
+=========================
+
+This module stores OCR text on disk keyed by a hash of the image content,
+so unchanged debug images are not re-OCR'd across runs.
+"""
+
+import hashlib
+import os
+import sqlite3
+from typing import Optional
+
+
+class OcrDiskCache:
+    """
+    Small SQLite-backed map from image content hash to OCR text.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the cache; the database is opened on first use."""
+        self.path = path
+        self._connection = None
+
+    @staticmethod
+    def hash_bytes(data: bytes) -> str:
+        """Return the SHA-256 of already-read file bytes."""
+        return hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def hash_file(image_path: str) -> Optional[str]:
+        """Return the SHA-256 of a file's bytes, or None if it cannot be read."""
+        try:
+            with open(image_path, 'rb') as image_file:
+                return OcrDiskCache.hash_bytes(image_file.read())
+        except OSError:
+            return None
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached text for key, or None on a miss."""
+        connection = self._connect()
+        if connection is None:
+            return None
+        try:
+            row = connection.execute('SELECT text FROM ocr WHERE key = ?', (key,)).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def set(self, key: str, text: str) -> None:
+        """Store text for key; failures (e.g. a locked database) are ignored."""
+        connection = self._connect()
+        if connection is None:
+            return
+        try:
+            with connection:
+                connection.execute('INSERT OR REPLACE INTO ocr (key, text) VALUES (?, ?)', (key, text))
+        except sqlite3.Error:
+            pass
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database lazily; returns None if its folder does not exist."""
+        if self._connection is None:
+            if not os.path.isdir(os.path.dirname(os.path.abspath(self.path))):
+                return None
+            self._connection = sqlite3.connect(self.path, timeout=30)
+            self._connection.execute('CREATE TABLE IF NOT EXISTS ocr (key TEXT PRIMARY KEY, text TEXT NOT NULL)')
+        return self._connection
+
+    def close(self) -> None:
+        """Close the database connection if one was opened."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def __getstate__(self):
+        # SQLite connections cannot be pickled; workers reopen the database on demand
+        state = self.__dict__.copy()
+        state['_connection'] = None
+        return state
+
+    def __del__(self):
+        self.close()
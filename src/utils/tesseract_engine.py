@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Tesseract Engine for TapTap
+===========================
+
+This module keeps Tesseract loaded in-process through tesserocr when it is
+installed, and falls back to pytesseract (one subprocess per call) otherwise.
+Batches on the subprocess path go through a single Tesseract list-file run.
+"""
+
+import os
+import subprocess
+import tempfile
+from typing import List, Optional
+
+import cv2
+import numpy as np
+import pytesseract
+
+try:
+    from tesserocr import PyTessBaseAPI, OEM
+except ImportError:
+    PyTessBaseAPI = None
+
+# Batch images go to RAM-backed storage when the system has it
+_BATCH_TEMP_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+class TesseractEngine:
+    """
+    Reusable Tesseract handle for one page segmentation mode.
+    """
+
+    def __init__(self, psm: int = 6, whitelist: Optional[str] = None):
+        """Initialize the engine; the tesserocr API is created on first use."""
+        self.psm = psm
+        self.whitelist = whitelist
+        self.config = self.build_config(psm, whitelist)
+        self._api = None
+
+    @staticmethod
+    def build_config(psm: int, whitelist: Optional[str] = None) -> str:
+        """Return the pytesseract/CLI config string for a PSM and optional whitelist."""
+        config = f'--oem 3 --psm {psm}'
+        if whitelist:
+            config += f' -c tessedit_char_whitelist={whitelist}'
+        return config
+
+    def set_psm(self, psm: int) -> None:
+        """Switch page segmentation mode without reloading the engine."""
+        if psm == self.psm:
+            return
+        self.psm = psm
+        self.config = self.build_config(psm, self.whitelist)
+        if self._api is not None:
+            self._api.SetPageSegMode(psm)
+
+    @property
+    def in_process(self) -> bool:
+        """True when OCR runs through tesserocr instead of a subprocess."""
+        return PyTessBaseAPI is not None
+
+    def image_to_string(self, image: np.ndarray) -> str:
+        """Run OCR on a grayscale or color ndarray and return the recognized text."""
+        if PyTessBaseAPI is None:
+            return pytesseract.image_to_string(image, config=self.config)
+
+        image = np.ascontiguousarray(image)
+        height, width = image.shape[:2]
+        channels = 1 if image.ndim == 2 else image.shape[2]
+
+        api = self._get_api()
+        api.SetImageBytes(image.tobytes(), width, height, channels, width * channels)
+        return api.GetUTF8Text()
+
+    def images_to_strings(self, images: List[np.ndarray]) -> List[str]:
+        """
+        OCR several ndarrays, returning one text per image in the same order.
+
+        Without tesserocr the images are written to a temporary folder and passed
+        to Tesseract as a list file, so the model is loaded once for the whole
+        batch. Tesseract ends every page with a form feed, which splits the output.
+        """
+        # In-process OCR has no per-call startup cost, so batching buys nothing
+        if len(images) <= 1 or self.in_process:
+            return [self.image_to_string(image) for image in images]
+
+        with tempfile.TemporaryDirectory(prefix="taptap_ocr_", dir=_BATCH_TEMP_DIR) as temp_dir:
+            image_paths = []
+            for i, image in enumerate(images):
+                image_path = os.path.join(temp_dir, f"{i:04d}.png")
+                # Read once by Tesseract and deleted, so skip most of the zlib work
+                cv2.imwrite(image_path, image, [cv2.IMWRITE_PNG_COMPRESSION, 1])
+                image_paths.append(image_path)
+
+            list_path = os.path.join(temp_dir, "list.txt")
+            with open(list_path, "w", encoding="utf-8") as list_file:
+                list_file.write("\n".join(image_paths) + "\n")
+
+            output_base = os.path.join(temp_dir, "out")
+            command = [pytesseract.pytesseract.tesseract_cmd, list_path, output_base]
+            completed = subprocess.run(command + self.config.split(), capture_output=True)
+            if completed.returncode != 0:
+                raise pytesseract.TesseractError(completed.returncode, completed.stderr.decode(errors="replace"))
+
+            with open(output_base + ".txt", encoding="utf-8") as output_file:
+                pages = output_file.read().split("\f")
+
+        # Pad in case Tesseract dropped trailing empty pages
+        pages += [''] * (len(images) - len(pages))
+        return pages[:len(images)]
+
+    def _get_api(self):
+        """Create the tesserocr API lazily so engines stay cheap to build and pickle."""
+        if self._api is None:
+            self._api = PyTessBaseAPI(psm=self.psm, oem=OEM.DEFAULT)
+            if self.whitelist:
+                self._api.SetVariable('tessedit_char_whitelist', self.whitelist)
+        return self._api
+
+    def close(self) -> None:
+        """Release the tesserocr API if one was created."""
+        if self._api is not None:
+            self._api.End()
+            self._api = None
+
+    def __getstate__(self):
+        # The native API handle cannot be pickled; workers recreate it on demand
+        state = self.__dict__.copy()
+        state['_api'] = None
+        return state
+
+    def __del__(self):
+        self.close()